@@ -7,20 +7,37 @@ Orastria AI-Powered Book Generator v6
 """
 
 import requests
+import hashlib
+import gzip
+import tempfile
+import shutil
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import NewConnectionError
 import json
+import re
 import time
 import math
+import random
 import os
-import urllib.request
+import atexit
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, white, black, Color
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-import textwrap
+from reportlab import rl_config
+
+# Attribute validation is only useful while developing drawings
+if not os.environ.get('ORASTRIA_DEBUG'):
+    rl_config.shapeChecking = 0
 
 # ============================================================
 # CONFIGURATION
@@ -29,10 +46,121 @@ import textwrap
 REPLICATE_URL = os.environ.get('REPLICATE_MODEL_URL', 'https://api.replicate.com/v1/models/anthropic/claude-3.5-sonnet/predictions')
 REPLICATE_API_KEY = os.environ.get('REPLICATE_API_KEY', '')
 
+# Limits of the default model (claude-3.5-sonnet) - override for another REPLICATE_MODEL_URL
+MODEL_CONTEXT_TOKENS = int(os.environ.get('ORASTRIA_MODEL_CONTEXT_TOKENS', '200000'))
+MODEL_MAX_OUTPUT_TOKENS = int(os.environ.get('ORASTRIA_MODEL_MAX_OUTPUT_TOKENS', '8192'))
+
+# Optional Redis cache for Claude responses, keyed by prompt (30 days)
+REDIS_URL = os.environ.get('REDIS_URL', '')
+REDIS_CLIENT = None
+LLM_CACHE_TTL = 30 * 86400
+
+# Without Redis, ORASTRIA_LLM_CACHE=1 caches Claude responses on local disk
+# instead (7 days) - meant for development and re-runs, off by default
+LLM_DISK_CACHE = bool(os.environ.get('ORASTRIA_LLM_CACHE'))
+LLM_CACHE_DIR = os.environ.get('ORASTRIA_LLM_CACHE_DIR', os.path.expanduser('~/.orastria/llm_cache'))
+LLM_DISK_CACHE_TTL = 7 * 86400
+
+# Finished sections are saved here so a failed run resumes where it stopped
+# (set ORASTRIA_PROGRESS_DIR= to disable)
+BOOK_PROGRESS_DIR = os.environ.get('ORASTRIA_PROGRESS_DIR', '/tmp/orastria_progress')
+BOOK_PROGRESS_TTL = 86400
+
+# Optional cache of finished PDFs, so a repeated request (retry, re-download)
+# is a file copy - off unless ORASTRIA_BOOK_CACHE_DIR is set
+BOOK_CACHE_DIR = os.environ.get('ORASTRIA_BOOK_CACHE_DIR', '')
+BOOK_CACHE_TTL = 7 * 86400
+
+# Book sections are independent, so generate several at once - a book is ~9
+# calls (4 section groups, forecast/important dates, 4 compatibility/monthly batches)
+AI_MAX_WORKERS = int(os.environ.get('ORASTRIA_AI_CONCURRENCY', '8'))
+
 # Prokerala API credentials
 PROKERALA_CLIENT_ID = os.environ.get('PROKERALA_CLIENT_ID', '')
 PROKERALA_CLIENT_SECRET = os.environ.get('PROKERALA_CLIENT_SECRET', '')
 
+# On-disk cache for geocoding and chart responses (30 days)
+PROKERALA_CACHE_DIR = os.environ.get('PROKERALA_CACHE_DIR', '/tmp/prokerala_cache')
+PROKERALA_CACHE_TTL = 30 * 86400
+
+# OAuth token shared across workers/processes until it expires
+PROKERALA_TOKEN_PATH = os.environ.get('PROKERALA_TOKEN_PATH', '/tmp/prokerala_token.json')
+PROKERALA_TOKEN = {}
+
+# Opt-in HTTP/2 for api.prokerala.com (needs `pip install httpx[http2]`)
+PROKERALA_HTTP2 = bool(os.environ.get('PROKERALA_HTTP2'))
+
+# ============================================================
+# HTTP SESSIONS
+# ============================================================
+
+def make_http_session(pool_connections=10, pool_maxsize=10, max_retries=0):
+    """Create a requests Session with pooled keep-alive connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Shared by the Prokerala token/chart calls and Nominatim geocoding
+PROKERALA_SESSION = make_http_session(max_retries=Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=None,
+    raise_on_status=False
+))
+
+
+def make_http2_client():
+    """Create a pooled HTTP/2 httpx client, or None if httpx[http2] is unavailable"""
+    try:
+        import httpx
+        import h2  # noqa: F401 - required by httpx for http2=True
+    except ImportError:
+        print("⚠️ httpx[http2] not installed, using requests for Prokerala")
+        return None
+    # With an explicit transport httpx ignores the Client's own http2/limits, so both go here
+    return httpx.Client(
+        timeout=30,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        ),
+    )
+
+# Prokerala token/chart calls multiplex over one HTTP/2 connection when enabled;
+# the client exposes the same get/post/json/raise_for_status surface as requests
+PROKERALA_CLIENT = (make_http2_client() if PROKERALA_HTTP2 else None) or PROKERALA_SESSION
+
+# Replicate prediction POSTs and status polls reuse pooled keep-alive connections
+# (sized so every generation thread, and its poll, gets its own connection).
+# Error statuses are only retried here for the idempotent GETs (polls, streams) -
+# re-sending a POST could start a second prediction, so create_prediction
+# decides that itself.
+REPLICATE_SESSION = make_http_session(
+    pool_connections=16,
+    pool_maxsize=max(32, 2 * AI_MAX_WORKERS),
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False
+    )
+)
+REPLICATE_SESSION.headers.update({
+    "Authorization": f"Bearer {REPLICATE_API_KEY}",
+    "Content-Type": "application/json"
+})
+
+# Close pooled keep-alive connections cleanly when the worker exits
+atexit.register(REPLICATE_SESSION.close)
+atexit.register(PROKERALA_SESSION.close)
+if PROKERALA_CLIENT is not PROKERALA_SESSION:
+    atexit.register(PROKERALA_CLIENT.close)
+
 # ============================================================
 # FONT MANAGEMENT
 # ============================================================
@@ -47,38 +175,115 @@ FONT_URLS = {
     'DejaVuSans-Bold.ttf': 'https://cdn.jsdelivr.net/npm/dejavu-fonts-ttf@2.37.3/ttf/DejaVuSans-Bold.ttf',
 }
 
+# Optional internal mirror (e.g. an S3 bucket) holding the .ttf files by file name;
+# tried before the public CDN URLs above
+FONT_MIRROR = os.environ.get('ORASTRIA_FONT_MIRROR', '').rstrip('/')
+
+# Anything smaller is an error page or a truncated transfer, not a font
+MIN_FONT_BYTES = 1000
+
+
+def font_download_urls(font_file):
+    """Candidate URLs for a font file, mirror first"""
+    urls = [FONT_URLS[font_file]]
+    if FONT_MIRROR:
+        urls.insert(0, f"{FONT_MIRROR}/{font_file}")
+    return urls
+
+
+def download_font(session, urls, font_path):
+    """Download one font file - best effort, never leaves a partial file"""
+    for url in urls:
+        tmp_path = None
+        try:
+            print(f"Downloading {os.path.basename(font_path)}...")
+            response = session.get(url, timeout=30, stream=True)
+            response.raise_for_status()
+            with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(font_path), suffix='.tmp', delete=False) as tmp:
+                tmp_path = tmp.name
+                for chunk in response.iter_content(chunk_size=65536):
+                    tmp.write(chunk)
+            if os.path.getsize(tmp_path) < MIN_FONT_BYTES:
+                raise ValueError(f"only {os.path.getsize(tmp_path)} bytes received")
+            os.replace(tmp_path, font_path)
+            return True
+        except Exception as e:
+            print(f"Failed to download {os.path.basename(font_path)} from {url}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    return False
+
+
+# Fonts shipped next to this module take priority; missing ones are downloaded
+BUNDLED_FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+FONT_CACHE_DIR = '/app/fonts' if os.path.exists('/app') else BUNDLED_FONT_DIR
+
+
+@lru_cache(maxsize=1)
+def font_index():
+    """Map font file name -> path for every bundled or previously downloaded font.
+    Scanned once per process; ensure_fonts adds fonts it downloads to the same dict."""
+    index = {}
+    # One listdir per directory instead of a stat per font; bundled fonts win
+    for font_dir in (FONT_CACHE_DIR, BUNDLED_FONT_DIR):
+        try:
+            names = os.listdir(font_dir)
+        except OSError:
+            continue
+        for name in names:
+            index[name] = os.path.join(font_dir, name)
+    return index
+
+
+def find_font(font_file):
+    """Return the path of a bundled or previously downloaded font, or None"""
+    return font_index().get(font_file)
+
+
+# Registered font name -> font file
+FONT_FILES = {
+    'Raleway': 'Raleway-Regular.ttf',
+    'Raleway-Bold': 'Raleway-Bold.ttf',
+    'Raleway-Italic': 'Raleway-Italic.ttf',
+    'EBGaramond': 'EBGaramond-Regular.ttf',
+    'EBGaramond-Bold': 'EBGaramond-Bold.ttf',
+    'DejaVuSans': 'DejaVuSans.ttf',
+    'DejaVuSans-Bold': 'DejaVuSans-Bold.ttf',
+}
+
+
+@lru_cache(maxsize=1)
 def ensure_fonts():
-    """Download and register fonts"""
-    if os.path.exists('/app'):
-        font_dir = '/app/fonts'
-    else:
-        font_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+    """Download (only if not bundled) and register fonts, once per process"""
+    already_registered = set(pdfmetrics.getRegisteredFontNames())
+    fonts_registered = {name: True for name in FONT_FILES if name in already_registered}
+    pending = {name: font_file for name, font_file in FONT_FILES.items() if name not in fonts_registered}
     
-    os.makedirs(font_dir, exist_ok=True)
+    existing = font_index()
+    missing = [
+        (font_download_urls(font_file), os.path.join(FONT_CACHE_DIR, font_file))
+        for font_file in pending.values()
+        if font_file not in existing
+    ]
     
-    for font_name, url in FONT_URLS.items():
-        font_path = os.path.join(font_dir, font_name)
-        if not os.path.exists(font_path):
-            try:
-                print(f"Downloading {font_name}...")
-                urllib.request.urlretrieve(url, font_path)
-            except Exception as e:
-                print(f"Failed to download {font_name}: {e}")
-    
-    fonts_registered = {}
-    font_mappings = {
-        'Raleway': 'Raleway-Regular.ttf',
-        'Raleway-Bold': 'Raleway-Bold.ttf',
-        'Raleway-Italic': 'Raleway-Italic.ttf',
-        'EBGaramond': 'EBGaramond-Regular.ttf',
-        'EBGaramond-Bold': 'EBGaramond-Bold.ttf',
-        'DejaVuSans': 'DejaVuSans.ttf',
-        'DejaVuSans-Bold': 'DejaVuSans-Bold.ttf',
-    }
+    # Fetch all missing fonts in parallel over one pooled session
+    if missing:
+        os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+        session = make_http_session(pool_maxsize=8, max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        ))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda args: download_font(session, *args), missing))
+        session.close()
+        for (urls, font_path), ok in zip(missing, results):
+            if ok:
+                existing[os.path.basename(font_path)] = font_path
     
-    for font_name, font_file in font_mappings.items():
-        font_path = os.path.join(font_dir, font_file)
-        if os.path.exists(font_path):
+    for font_name, font_file in pending.items():
+        font_path = existing.get(font_file)
+        if font_path:
             try:
                 pdfmetrics.registerFont(TTFont(font_name, font_path))
                 fonts_registered[font_name] = True
@@ -87,17 +292,40 @@ def ensure_fonts():
     
     return fonts_registered
 
-FONTS = ensure_fonts()
-
-FONT_BODY = 'Raleway' if 'Raleway' in FONTS else 'Helvetica'
-FONT_BODY_BOLD = 'Raleway-Bold' if 'Raleway-Bold' in FONTS else 'Helvetica-Bold'
-FONT_BODY_ITALIC = 'Raleway-Italic' if 'Raleway-Italic' in FONTS else 'Helvetica-Oblique'
-FONT_HEADING = 'EBGaramond' if 'EBGaramond' in FONTS else 'Times-Roman'
-FONT_HEADING_BOLD = 'EBGaramond-Bold' if 'EBGaramond-Bold' in FONTS else 'Times-Bold'
-FONT_SYMBOL = 'DejaVuSans' if 'DejaVuSans' in FONTS else 'Helvetica'
-FONT_SYMBOL_BOLD = 'DejaVuSans-Bold' if 'DejaVuSans-Bold' in FONTS else 'Helvetica-Bold'
-
-print(f"Using fonts: Body={FONT_BODY}, Heading={FONT_HEADING}, Symbol={FONT_SYMBOL}")
+# Fonts are downloaded/registered on the first book, not at import, so importing this
+# module (Flask app startup, bulk workers) stays cheap. Until then the built-in
+# fallbacks below are in effect.
+FONTS = None
+FONTS_LOCK = threading.Lock()
+
+FONT_BODY = 'Helvetica'
+FONT_BODY_BOLD = 'Helvetica-Bold'
+FONT_BODY_ITALIC = 'Helvetica-Oblique'
+FONT_HEADING = 'Times-Roman'
+FONT_HEADING_BOLD = 'Times-Bold'
+FONT_SYMBOL = 'Helvetica'
+FONT_SYMBOL_BOLD = 'Helvetica-Bold'
+
+
+def setup_fonts():
+    """Register the book fonts on first use and point the FONT_* names at them"""
+    global FONTS, FONT_BODY, FONT_BODY_BOLD, FONT_BODY_ITALIC, FONT_HEADING, FONT_HEADING_BOLD, FONT_SYMBOL, FONT_SYMBOL_BOLD
+    with FONTS_LOCK:
+        if FONTS is not None:
+            return FONTS
+        
+        fonts = ensure_fonts()
+        FONT_BODY = 'Raleway' if 'Raleway' in fonts else 'Helvetica'
+        FONT_BODY_BOLD = 'Raleway-Bold' if 'Raleway-Bold' in fonts else 'Helvetica-Bold'
+        FONT_BODY_ITALIC = 'Raleway-Italic' if 'Raleway-Italic' in fonts else 'Helvetica-Oblique'
+        FONT_HEADING = 'EBGaramond' if 'EBGaramond' in fonts else 'Times-Roman'
+        FONT_HEADING_BOLD = 'EBGaramond-Bold' if 'EBGaramond-Bold' in fonts else 'Times-Bold'
+        FONT_SYMBOL = 'DejaVuSans' if 'DejaVuSans' in fonts else 'Helvetica'
+        FONT_SYMBOL_BOLD = 'DejaVuSans-Bold' if 'DejaVuSans-Bold' in fonts else 'Helvetica-Bold'
+        FONTS = fonts
+        
+        print(f"Using fonts: Body={FONT_BODY}, Heading={FONT_HEADING}, Symbol={FONT_SYMBOL}")
+        return FONTS
 
 # ============================================================
 # COLORS
@@ -115,6 +343,33 @@ ORANGE = HexColor('#e67e22')
 RED = HexColor('#e74c3c')
 LIGHT_GRAY = HexColor('#ecf0f1')
 
+# Text and rule grays
+DARK_GRAY = HexColor('#444444')
+MID_GRAY = HexColor('#666666')
+SOFT_GRAY = HexColor('#888888')
+RULE_GRAY = HexColor('#cccccc')
+
+# Chart wheel and summary cards
+MOON_BLUE = HexColor('#7788AA')
+WHEEL_CENTER = HexColor('#faf8f5')
+RISING_HIGHLIGHT = HexColor('#AA7755')
+MOON_HIGHLIGHT = HexColor('#8899AA')
+CARD_FILL = HexColor('#f5f3ef')
+CARD_BORDER = HexColor('#e0dcd5')
+
+# Upsell page palette
+DEEP_NAVY = HexColor('#0f1628')
+MID_NAVY = HexColor('#252b4a')
+GRADIENT_NAVY = HexColor('#1a2040')
+BORDER_NAVY = HexColor('#3a4060')
+PURPLE_ICON = HexColor('#6b4c9a')
+LIGHT_PURPLE = HexColor('#9b7bc7')
+TEAL = HexColor('#2d7a6d')
+LIGHT_TEAL = HexColor('#3a9a8a')
+MUTED_LAVENDER = HexColor('#9999aa')
+FOOTER_GRAY = HexColor('#555566')
+BUTTON_SHADOW = HexColor('#a07d1f')
+
 # Book color themes
 COLOR_THEMES = {
     'black': {'primary': HexColor('#1a1a1a'), 'accent': GOLD},
@@ -127,6 +382,88 @@ COLOR_THEMES = {
     'navy': {'primary': NAVY, 'accent': GOLD},
 }
 
+# ============================================================
+# DISK CACHE
+# ============================================================
+
+def cache_key(*parts):
+    """Build a filesystem-safe cache key from request parameters"""
+    return hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+# orjson (optional) speeds up the disk caches - its files are plain JSON either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Expired entries are deleted when read, and each cache directory is swept for
+# expired files at most once per CACHE_PRUNE_INTERVAL seconds when written to
+CACHE_PRUNE_INTERVAL = 3600
+CACHE_LAST_PRUNE = {}
+
+
+def cache_get(cache_dir, key, max_age):
+    """Return the cached JSON value for key, or None if missing or expired"""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > max_age:
+            os.unlink(path)
+            return None
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson else json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_delete(cache_dir, key):
+    """Remove a cache entry if present"""
+    try:
+        os.unlink(os.path.join(cache_dir, f"{key}.json"))
+    except OSError:
+        pass
+
+
+def cache_set(cache_dir, key, value, max_age):
+    """Atomically write a JSON value to the cache - failures are non-fatal"""
+    tmp_name = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=cache_dir, suffix='.tmp', delete=False) as tmp:
+            tmp_name = tmp.name
+            tmp.write(orjson.dumps(value) if orjson else json.dumps(value).encode('utf-8'))
+        os.replace(tmp_name, os.path.join(cache_dir, f"{key}.json"))
+    except (OSError, TypeError) as e:
+        print(f"⚠️ Cache write failed: {e}")
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    
+    now = time.time()
+    if now - CACHE_LAST_PRUNE.get(cache_dir, 0) > CACHE_PRUNE_INTERVAL:
+        CACHE_LAST_PRUNE[cache_dir] = now
+        prune_cache(cache_dir, max_age)
+
+
+def prune_cache(cache_dir, max_age):
+    """Delete cache entries (and leftover temp files) older than max_age seconds"""
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(('.json', '.tmp')):
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+
 # ============================================================
 # ZODIAC DATA
 # ============================================================
@@ -155,6 +492,16 @@ ZODIAC_DATA = {
     "Pisces": {"element": "Water", "modality": "Mutable", "ruler": "Neptune", "crystal": "Aquamarine"}
 }
 
+# Unit-circle positions on the birth chart wheel: house lines and zodiac glyphs
+WHEEL_HOUSE_POINTS = [
+    (math.cos(math.radians(90 - i * 30)), math.sin(math.radians(90 - i * 30)))
+    for i in range(12)
+]
+WHEEL_SIGN_POINTS = {
+    sign: (math.cos(math.radians(75 - i * 30)), math.sin(math.radians(75 - i * 30)))
+    for i, sign in enumerate(ZODIAC_ORDER)
+}
+
 # ============================================================
 # PROKERALA API INTEGRATION (matching working sample book)
 # ============================================================
@@ -168,8 +515,54 @@ ZODIAC_SIGNS = [
 AYANAMSA = 24.0
 
 
+def load_cached_prokerala_token():
+    """Return a still-valid token from memory or the token file, or None"""
+    now = datetime.now()
+    if PROKERALA_TOKEN.get('expiry') and PROKERALA_TOKEN['expiry'] > now:
+        return PROKERALA_TOKEN['token']
+    
+    try:
+        with open(PROKERALA_TOKEN_PATH) as f:
+            saved = json.load(f)
+        expiry = datetime.fromisoformat(saved['expiry'])
+    except (OSError, ValueError, KeyError):
+        return None
+    
+    # Ignore tokens issued for different credentials
+    if saved.get('client_id') != PROKERALA_CLIENT_ID or expiry <= now:
+        return None
+    
+    PROKERALA_TOKEN.update(token=saved['token'], expiry=expiry)
+    return saved['token']
+
+
+def save_prokerala_token(token, expiry):
+    """Remember the token in memory and persist it for other processes"""
+    PROKERALA_TOKEN.update(token=token, expiry=expiry)
+    
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    
+    try:
+        fd = os.open(PROKERALA_TOKEN_PATH, os.O_WRONLY | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            os.fchmod(f.fileno(), 0o600)
+            f.truncate()
+            json.dump({'token': token, 'expiry': expiry.isoformat(), 'client_id': PROKERALA_CLIENT_ID}, f)
+    except OSError as e:
+        print(f"⚠️ Could not persist Prokerala token: {e}")
+
+
 def get_prokerala_token():
     """Get OAuth token from Prokerala - EXACT working version"""
+    token = load_cached_prokerala_token()
+    if token:
+        return token
+    
     # Debug: show credential info
     print(f"🔑 CLIENT_ID: '{PROKERALA_CLIENT_ID[:8]}...{PROKERALA_CLIENT_ID[-4:]}' (len={len(PROKERALA_CLIENT_ID)})")
     print(f"🔑 CLIENT_SECRET: '{PROKERALA_CLIENT_SECRET[:8]}...{PROKERALA_CLIENT_SECRET[-4:]}' (len={len(PROKERALA_CLIENT_SECRET)})")
@@ -191,14 +584,19 @@ def get_prokerala_token():
     
     print(f"📤 Requesting token from: {url}")
     
-    response = requests.post(url, data=data)
+    response = PROKERALA_CLIENT.post(url, data=data, timeout=30)
     
     print(f"📥 Response status: {response.status_code}")
     if response.status_code != 200:
         print(f"📥 Response body: {response.text[:500]}")
     
     response.raise_for_status()
-    return response.json()['access_token']
+    payload = response.json()
+    
+    # Refresh a minute early so a token never expires mid-request
+    expiry = datetime.now() + timedelta(seconds=int(payload.get('expires_in', 3600)) - 60)
+    save_prokerala_token(payload['access_token'], expiry)
+    return payload['access_token']
 
 
 def get_timezone_from_coords(lat, lon, place_name):
@@ -219,21 +617,28 @@ def get_timezone_from_coords(lat, lon, place_name):
     return guess_timezone_from_coords(lat, lon, place_name)
 
 
-def geocode_location(place_name):
+def geocode_location(place_name, force_refresh=False):
     """Get latitude, longitude, and timezone for a place using Nominatim"""
-    # Using Nominatim (free, no API key needed)
-    url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        'q': place_name,
-        'format': 'json',
-        'limit': 1
-    }
-    headers = {'User-Agent': 'OrastriaApp/1.0'}
+    key = cache_key('geocode', place_name)
+    results = None if force_refresh else cache_get(PROKERALA_CACHE_DIR, key, PROKERALA_CACHE_TTL)
     
-    response = requests.get(url, params=params, headers=headers, timeout=30)
-    response.raise_for_status()
+    if results is None:
+        # Using Nominatim (free, no API key needed)
+        url = "https://nominatim.openstreetmap.org/search"
+        params = {
+            'q': place_name,
+            'format': 'json',
+            'limit': 1
+        }
+        headers = {'User-Agent': 'OrastriaApp/1.0'}
+        
+        response = PROKERALA_SESSION.get(url, params=params, headers=headers, timeout=30)
+        response.raise_for_status()
+        
+        results = response.json()
+        if results:
+            cache_set(PROKERALA_CACHE_DIR, key, results, PROKERALA_CACHE_TTL)
     
-    results = response.json()
     if not results:
         raise ValueError(f"Could not find location: {place_name}")
     
@@ -334,12 +739,19 @@ def longitude_to_tropical_sign(longitude):
     return ZODIAC_SIGNS[sign_index]
 
 
-def get_birth_chart(birth_date, birth_time, latitude, longitude, timezone):
+def get_birth_chart(birth_date, birth_time, latitude, longitude, timezone, token=None, force_refresh=False):
     """Get birth chart from Prokerala API - EXACT working version"""
-    token = get_prokerala_token()
-    
     datetime_str = f"{birth_date}T{birth_time}:00{get_tz_offset(timezone)}"
     
+    key = cache_key('chart', datetime_str, latitude, longitude)
+    cached = None if force_refresh else cache_get(PROKERALA_CACHE_DIR, key, PROKERALA_CACHE_TTL)
+    if cached:
+        print("📦 Using cached Prokerala chart")
+        return parse_chart_data(cached['planet_data'], cached['kundli_data'])
+    
+    if token is None:
+        token = get_prokerala_token()
+    
     url = "https://api.prokerala.com/v2/astrology/planet-position"
     headers = {"Authorization": f"Bearer {token}"}
     params = {
@@ -348,19 +760,39 @@ def get_birth_chart(birth_date, birth_time, latitude, longitude, timezone):
         "datetime": datetime_str
     }
     
-    response = requests.get(url, headers=headers, params=params, timeout=30)
-    response.raise_for_status()
+    # Also get the ascendant/rising sign - both requests run concurrently
+    asc_url = "https://api.prokerala.com/v2/astrology/kundli"
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        planet_future = pool.submit(PROKERALA_CLIENT.get, url, headers=headers, params=params, timeout=30)
+        asc_future = pool.submit(PROKERALA_CLIENT.get, asc_url, headers=headers, params=params, timeout=30)
+        response = planet_future.result()
+        asc_response = asc_future.result()
     
+    response.raise_for_status()
     data = response.json()['data']
+    asc_data = asc_response.json()['data'] if asc_response.status_code < 400 else None
     
-    # Also get the ascendant/rising sign
-    asc_url = "https://api.prokerala.com/v2/astrology/kundli"
-    asc_response = requests.get(asc_url, headers=headers, params=params, timeout=30)
-    asc_data = asc_response.json()['data'] if asc_response.ok else None
+    # Only cache complete responses so a failed kundli call is retried next time
+    if asc_data:
+        cache_set(PROKERALA_CACHE_DIR, key, {'planet_data': data, 'kundli_data': asc_data}, PROKERALA_CACHE_TTL)
     
     return parse_chart_data(data, asc_data)
 
 
+# Prokerala planet name -> chart_data key
+PLANET_NAME_MAP = {
+    'Sun': 'sun_sign',
+    'Moon': 'moon_sign',
+    'Mercury': 'mercury',
+    'Venus': 'venus',
+    'Mars': 'mars',
+    'Jupiter': 'jupiter',
+    'Saturn': 'saturn',
+    'Rahu': 'north_node',
+    'Ascendant': 'rising_sign'
+}
+
+
 def parse_chart_data(planet_data, kundli_data):
     """Parse Prokerala response into our format - converts to Western/Tropical zodiac"""
     
@@ -377,38 +809,18 @@ def parse_chart_data(planet_data, kundli_data):
         'north_node': 'Aries',
     }
     
-    planet_name_map = {
-        'Sun': 'sun_sign',
-        'Moon': 'moon_sign',
-        'Mercury': 'mercury',
-        'Venus': 'venus',
-        'Mars': 'mars',
-        'Jupiter': 'jupiter',
-        'Saturn': 'saturn',
-        'Rahu': 'north_node',
-        'Ascendant': 'rising_sign'
-    }
-    
     # Parse planet positions
-    planets = planet_data.get('planet_position', [])
-    
-    for planet in planets:
-        planet_name = planet.get('name', '')
-        longitude = planet.get('longitude', 0)
+    for planet in planet_data.get('planet_position', []):
+        key = PLANET_NAME_MAP.get(planet.get('name', ''))
+        if key is None:
+            continue
         
+        longitude = planet.get('longitude', 0)
         if longitude > 0:
-            sign_name = longitude_to_tropical_sign(longitude)
+            chart[key] = longitude_to_tropical_sign(longitude)
         else:
-            rasi = planet.get('rasi', {})
-            rasi_id = rasi.get('id', -1)
-            if 0 <= rasi_id < 12:
-                tropical_rasi_id = (rasi_id + 1) % 12
-                sign_name = ZODIAC_SIGNS[tropical_rasi_id]
-            else:
-                sign_name = 'Aries'
-        
-        if planet_name in planet_name_map:
-            chart[planet_name_map[planet_name]] = sign_name
+            rasi_id = planet.get('rasi', {}).get('id', -1)
+            chart[key] = ZODIAC_SIGNS[(rasi_id + 1) % 12] if 0 <= rasi_id < 12 else 'Aries'
     
     # Get rising sign from kundli data if available
     if kundli_data:
@@ -421,19 +833,26 @@ def parse_chart_data(planet_data, kundli_data):
     return chart
 
 
-def get_chart_from_prokerala(birth_date, birth_time, birth_place):
+def get_chart_from_prokerala(birth_date, birth_time, birth_place, force_refresh=False):
     """Get complete chart data from Prokerala API"""
     if not PROKERALA_CLIENT_ID or not PROKERALA_CLIENT_SECRET:
         print("Prokerala credentials not configured")
         return None
     
     try:
-        print(f"📍 Geocoding: {birth_place}")
-        latitude, longitude, timezone = geocode_location(birth_place)
-        print(f"✅ Location: {latitude}, {longitude} (TZ: {timezone})")
+        # The token does not depend on the location, so fetch it while geocoding
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            token_future = pool.submit(get_prokerala_token)
+            
+            print(f"📍 Geocoding: {birth_place}")
+            latitude, longitude, timezone = geocode_location(birth_place, force_refresh=force_refresh)
+            print(f"✅ Location: {latitude}, {longitude} (TZ: {timezone})")
+            
+            token = token_future.result()
         
         print(f"🔮 Fetching chart from Prokerala...")
-        chart = get_birth_chart(birth_date, birth_time, latitude, longitude, timezone)
+        chart = get_birth_chart(birth_date, birth_time, latitude, longitude, timezone,
+                                token=token, force_refresh=force_refresh)
         print(f"✅ Chart received: Sun={chart['sun_sign']}, Moon={chart['moon_sign']}, Rising={chart['rising_sign']}")
         
         return chart
@@ -449,6 +868,22 @@ def get_chart_from_prokerala(birth_date, birth_time, birth_place):
 # NUMEROLOGY
 # ============================================================
 
+# Pythagorean letter values indexed by byte (0 for non-letters) - a full
+# 256-entry table so bytes.translate can map a whole name in one C call
+LETTER_VALUES = bytes(
+    ((i | 32) - ord('a')) % 9 + 1 if i < 128 and chr(i).isalpha() else 0 for i in range(256)
+)
+
+MASTER_NUMBERS = frozenset((11, 22, 33))
+
+def digit_sum(n):
+    total = 0
+    while n:
+        total += n % 10
+        n //= 10
+    return total
+
+@lru_cache(maxsize=4096)
 def calculate_life_path(birth_date):
     try:
         if "-" in birth_date:
@@ -458,74 +893,500 @@ def calculate_life_path(birth_date):
             dt = datetime.strptime(birth_date, "%B %d, %Y")
             year, month, day = dt.year, dt.month, dt.day
         
-        total = sum(int(d) for d in str(year)) + sum(int(d) for d in str(month)) + sum(int(d) for d in str(day))
+        total = digit_sum(year) + digit_sum(month) + digit_sum(day)
         
-        while total > 9 and total not in [11, 22, 33]:
-            total = sum(int(d) for d in str(total))
+        while total > 9 and total not in MASTER_NUMBERS:
+            total = digit_sum(total)
         
         return total
     except:
         return 7
 
+@lru_cache(maxsize=4096)
 def calculate_expression_number(name):
-    letter_values = {
-        'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6, 'g': 7, 'h': 8, 'i': 9,
-        'j': 1, 'k': 2, 'l': 3, 'm': 4, 'n': 5, 'o': 6, 'p': 7, 'q': 8, 'r': 9,
-        's': 1, 't': 2, 'u': 3, 'v': 4, 'w': 5, 'x': 6, 'y': 7, 'z': 8
-    }
-    total = sum(letter_values.get(c.lower(), 0) for c in name if c.isalpha())
-    while total > 9 and total not in [11, 22, 33]:
-        total = sum(int(d) for d in str(total))
+    total = sum(name.encode('ascii', 'ignore').translate(LETTER_VALUES))
+    while total > 9 and total not in MASTER_NUMBERS:
+        total = digit_sum(total)
     return total
 
 # ============================================================
 # AI CONTENT GENERATION
 # ============================================================
 
-def call_claude_api(prompt, max_tokens=1500):
-    """Call Claude API via Replicate"""
-    headers = {
-        "Authorization": f"Bearer {REPLICATE_API_KEY}",
-        "Content-Type": "application/json"
-    }
+# Replicate holds the POST open until the prediction finishes (up to 60s), so most
+# calls need no polling at all; slower ones are polled with backoff until the deadline
+REPLICATE_WAIT_SECONDS = 60
+REPLICATE_DEADLINE_SECONDS = 150
+
+# With REPLICATE_STREAM set, the POST returns immediately and the output is read
+# from the prediction's server-sent-events stream as tokens are produced
+REPLICATE_STREAM = bool(os.environ.get('REPLICATE_STREAM'))
+
+# Rate limits and 5xx on the POST are retried with jittered backoff; after
+# BREAKER_THRESHOLD consecutive server failures every call falls back straight
+# away for BREAKER_COOLDOWN seconds instead of queueing behind an outage
+REPLICATE_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+REPLICATE_MAX_RETRIES = 5
+BREAKER_THRESHOLD = 10
+BREAKER_COOLDOWN = 60
+BREAKER = {'failures': 0, 'open_until': 0.0}
+BREAKER_LOCK = threading.Lock()
+
+# Per book: after this many failed calls in a row the rest of the book is
+# written from cache and fallback text instead of waiting on more timeouts
+AI_FAILURE_LIMIT = 2
+
+
+def breaker_record(ok):
+    """Count consecutive Replicate server failures, opening the breaker at the threshold"""
+    with BREAKER_LOCK:
+        if ok:
+            BREAKER['failures'] = 0
+            return
+        BREAKER['failures'] += 1
+        if BREAKER['failures'] >= BREAKER_THRESHOLD:
+            BREAKER['open_until'] = time.monotonic() + BREAKER_COOLDOWN
+
+
+def breaker_open():
+    return time.monotonic() < BREAKER['open_until']
+
+
+def retry_delay(response, attempt):
+    """Seconds to wait before retry `attempt` - Retry-After if given, else exponential with jitter"""
+    retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+    if retry_after.isdigit():
+        return min(30, int(retry_after))
+    return min(30, 2 ** attempt + random.random())
+
+
+def failed_before_sending(error):
+    """True if a requests.ConnectionError happened while connecting, before any of the request was sent"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    # Exhausted urllib3 connect retries arrive wrapped in a MaxRetryError
+    return isinstance(getattr(reason, 'reason', reason), NewConnectionError)
+
+
+def create_prediction(payload, headers, timeout, deadline):
+    """POST a prediction, retrying rate limits, 5xx and failed connects, and return its JSON"""
+    for attempt in range(REPLICATE_MAX_RETRIES + 1):
+        response = None
+        try:
+            response = REPLICATE_SESSION.post(REPLICATE_URL, headers=headers, json=payload, timeout=timeout)
+        except requests.ConnectionError as e:
+            breaker_record(False)
+            # A reset or disconnect after the body went out may have started the
+            # prediction already - like a timeout, don't risk paying for it twice
+            if not failed_before_sending(e):
+                raise
+            error = e
+        except requests.Timeout:
+            # The prediction may already be running - count the outage, but don't pay for it twice
+            breaker_record(False)
+            raise
+        else:
+            if response.status_code not in REPLICATE_RETRY_STATUSES:
+                breaker_record(response.status_code < 500)
+                response.raise_for_status()
+                return response.json()
+            if response.status_code >= 500:
+                breaker_record(False)
+            error = requests.HTTPError(f"{response.status_code} from Replicate", response=response)
+        
+        delay = retry_delay(response, attempt)
+        if attempt == REPLICATE_MAX_RETRIES or breaker_open() or time.monotonic() + delay >= deadline:
+            raise error
+        print(f"⚠️ Replicate: {error} - retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+
+def prediction_output(prediction):
+    """Return the text of a finished prediction"""
+    output = prediction.get("output", "")
+    if isinstance(output, list):
+        return "".join(output)
+    return output
+
+
+def read_prediction_stream(stream_url):
+    """Collect a prediction's streamed output; None if the stream errors or ends early"""
+    response = REPLICATE_SESSION.get(
+        stream_url,
+        headers={"Accept": "text/event-stream", "Cache-Control": "no-store"},
+        stream=True,
+        timeout=(10, REPLICATE_WAIT_SECONDS)
+    )
+    response.raise_for_status()
     
+    chunks = []
+    event, data = None, []
+    with response:
+        for line in response.iter_lines(decode_unicode=True):
+            if line:
+                field, _, value = line.partition(':')
+                value = value[1:] if value.startswith(' ') else value
+                if field == 'event':
+                    event = value
+                elif field == 'data':
+                    data.append(value)
+                continue
+            
+            # A blank line ends one event
+            if event == 'output':
+                chunks.append("\n".join(data))
+            elif event == 'done':
+                return "".join(chunks)
+            elif event == 'error':
+                print(f"API stream error: {' '.join(data)}")
+                return None
+            event, data = None, []
+    return None
+
+
+def replicate_predict(prompt, max_tokens=1500, system_prompt=None):
+    """Run one Claude prediction on Replicate and return its text, or None"""
     payload = {
         "input": {
             "prompt": prompt,
             "max_tokens": max_tokens
         }
     }
+    if system_prompt:
+        payload["input"]["system_prompt"] = system_prompt
+    
+    # Without a key every POST is a guaranteed 401 - don't make it
+    if not REPLICATE_API_KEY:
+        return None
+    if breaker_open():
+        print("API Error: Replicate circuit open, using fallback")
+        return None
     
     try:
-        response = requests.post(REPLICATE_URL, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        prediction = response.json()
-        
-        prediction_url = prediction.get("urls", {}).get("get")
-        if not prediction_url:
-            return None
+        deadline = time.monotonic() + REPLICATE_DEADLINE_SECONDS
+        if REPLICATE_STREAM:
+            prediction = create_prediction({**payload, "stream": True}, None, 30, deadline)
+        else:
+            prediction = create_prediction(
+                payload,
+                {"Prefer": f"wait={REPLICATE_WAIT_SECONDS}"},
+                REPLICATE_WAIT_SECONDS + 15,
+                deadline
+            )
+        
+        stream_url = prediction.get("urls", {}).get("stream")
+        if REPLICATE_STREAM and stream_url and prediction.get("status") not in ("succeeded", "failed", "canceled"):
+            try:
+                output = read_prediction_stream(stream_url)
+                if output is not None:
+                    return output
+            except Exception as e:
+                print(f"API stream failed, polling instead: {e}")
         
-        for _ in range(90):
-            time.sleep(1)
-            result = requests.get(prediction_url, headers=headers, timeout=30)
-            result_data = result.json()
-            
-            status = result_data.get("status")
+        attempt = 0
+        while True:
+            status = prediction.get("status")
             if status == "succeeded":
-                output = result_data.get("output", "")
-                if isinstance(output, list):
-                    return "".join(output)
-                return output
-            elif status == "failed":
+                return prediction_output(prediction)
+            elif status in ("failed", "canceled"):
                 return None
-        
-        return None
+            
+            prediction_url = prediction.get("urls", {}).get("get")
+            if not prediction_url or time.monotonic() >= deadline:
+                return None
+            
+            time.sleep(min(2.0, 0.25 * (1.5 ** attempt)))
+            attempt += 1
+            result = REPLICATE_SESSION.get(prediction_url, timeout=30)
+            prediction = result.json()
         
     except Exception as e:
         print(f"API Error: {e}")
         return None
 
 
+def get_redis():
+    """Shared Redis client for the LLM response cache, or None if not configured"""
+    global REDIS_CLIENT
+    if REDIS_CLIENT is None and REDIS_URL:
+        try:
+            import redis
+            REDIS_CLIENT = redis.Redis.from_url(REDIS_URL, socket_timeout=2)
+        except ImportError:
+            print("⚠️ redis not installed, LLM response cache disabled")
+            REDIS_CLIENT = False
+    return REDIS_CLIENT or None
+
+
+def llm_cache_get(key):
+    client = get_redis()
+    if client:
+        try:
+            value = client.get(key)
+            return gzip.decompress(value).decode('utf-8') if value else None
+        except Exception as e:
+            print(f"⚠️ LLM cache read failed: {e}")
+            return None
+    if LLM_DISK_CACHE:
+        return cache_get(LLM_CACHE_DIR, key.replace(':', '-'), LLM_DISK_CACHE_TTL)
+    return None
+
+
+def llm_cache_set(key, text):
+    client = get_redis()
+    if client:
+        try:
+            client.setex(key, LLM_CACHE_TTL, gzip.compress(text.encode('utf-8')))
+        except Exception as e:
+            print(f"⚠️ LLM cache write failed: {e}")
+    elif LLM_DISK_CACHE:
+        cache_set(LLM_CACHE_DIR, key.replace(':', '-'), text, LLM_DISK_CACHE_TTL)
+
+
+# Predictions currently running, by cache key - a concurrent identical prompt
+# waits for the running one instead of paying for a second prediction
+INFLIGHT = {}
+INFLIGHT_LOCK = threading.Lock()
+
+
+def call_claude_api(prompt, max_tokens=1500, nocache=False, cache_only=False, system_prompt=None):
+    """Call Claude API via Replicate, reusing cached responses (Redis, or disk with ORASTRIA_LLM_CACHE)"""
+    # Whitespace-insensitive key, so stray spaces/newlines in the answers still hit the cache
+    normalized = ' '.join(f"{system_prompt or ''}|{prompt}".split())
+    key = f"claude:{hashlib.sha256(f'{max_tokens}|{normalized}'.encode('utf-8')).hexdigest()}"
+    if not nocache:
+        cached = llm_cache_get(key)
+        if cached:
+            return cached
+    if cache_only:
+        return None
+    
+    with INFLIGHT_LOCK:
+        pending = INFLIGHT.get(key)
+        if pending is None:
+            INFLIGHT[key] = future = Future()
+    if pending is not None:
+        return pending.result()
+    
+    result = None
+    try:
+        result = replicate_predict(prompt, max_tokens, system_prompt)
+        if result:
+            llm_cache_set(key, result)
+    finally:
+        with INFLIGHT_LOCK:
+            del INFLIGHT[key]
+        future.set_result(result)
+    return result
+
+
+def estimate_tokens(text):
+    """Conservative token count (~3 chars/token) - Replicate has no tokenize endpoint"""
+    return len(text) // 3 + 1
+
+
+MONTHS = ("January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December")
+
+# Section parsers for the batched compatibility/monthly responses, compiled once.
+# Splitting on the headings yields [preamble, heading, body, heading, body, ...]
+SIGN_SPLIT = re.compile(r'\b(' + '|'.join(sign.upper() for sign in ZODIAC_ORDER) + r'):\s*', re.IGNORECASE)
+MONTH_SPLIT = re.compile(r'\b(' + '|'.join(month.upper() for month in MONTHS) + r'):\s*', re.IGNORECASE)
+PERCENTAGE_RE = re.compile(r'PERCENTAGE:\s*(\d+)', re.IGNORECASE)
+PERCENT_RE = re.compile(r'(\d+)%')
+SECTION_MARKER_RE = re.compile(r'^\s*===\s*SECTION:\s*(\w+)\s*===\s*$', re.MULTILINE)
+
+# Output budgets sized from each prompt's word target (~1.35 tokens/word) with
+# ~50% headroom so a long answer is never cut off mid-sentence
+SECTION_MAX_TOKENS = {
+    'introduction': 1000,     # ~500 words
+    'sun_sign': 1200,         # ~600 words
+    'moon_sign': 1200,
+    'rising_sign': 1000,
+    'personality': 1400,      # ~700 words
+    'love': 1400,
+    'career': 1400,
+    'forecast': 1400,
+    'numerology': 1200,
+    'tarot': 1200,
+    'crystals': 1200,
+    'closing': 1000,
+    'important_dates': 1000,
+}
+BATCH_MAX_TOKENS = 2000       # 6 x ~150 words plus headings and percentages
+
+# Sections that share enough context to be written in a single call, so the
+# profile/chart context is sent once per group instead of once per section.
+# Groups stay at ~1000-2100 words: one call's latency grows with its output, so a
+# single all-sections prompt would be slower than these running side by side.
+SECTION_GROUPS = {
+    'big_three': ('sun_sign', 'moon_sign', 'rising_sign'),
+    'inner_life': ('personality', 'love', 'career'),
+    'practices': ('numerology', 'tarot', 'crystals'),
+    'bookends': ('introduction', 'closing'),
+}
+
+
+# Questionnaire answers that may arrive as lists
+LIST_FIELDS = ('main_goals', 'relationship_goals', 'desired_partner_traits',
+               'birth_chart_includes', 'important_dates', 'additional_topics')
+
+
+# Per-section prompt templates, filled by generate_all() with format_map(); answers
+# missing from the questionnaire render as None, like the old inline f-strings did
+SECTION_PROMPTS = {
+    'introduction': """Write a warm, personalized introduction (4-5 paragraphs, ~500 words).
+Include:
+1. Welcome them by name ({first_name})
+2. Reference their specific main goals: {main_goals}
+3. Acknowledge their astrology knowledge level ({astrology_familiarity})
+4. Mention if they have a significant life event coming: {significant_life_event_soon}
+5. Make them feel this book was written just for them""",
+    
+    'sun_sign': """Write comprehensive {sun_sign} Sun analysis (5-6 paragraphs, ~600 words).
+Include:
+1. The essence of {sun_sign} energy
+2. How it connects to their outlook: {outlook}
+3. How their dreams ("{life_dreams}") align with {sun_sign} traits
+4. {sun_sign} strengths and shadows
+5. How it interacts with their {moon_sign} Moon and {rising_sign} Rising""",
+    
+    'moon_sign': """Write deep {moon_sign} Moon analysis (5-6 paragraphs, ~600 words).
+Include:
+1. Their emotional nature as a {moon_sign} Moon
+2. What they need to feel secure
+3. How they process emotions - connect to: {logic_vs_emotions}
+4. Their tendency to overthink: {overthink_relationships}
+5. How {moon_sign} Moon shapes their love language: {love_language}""",
+    
+    'rising_sign': """Write about {rising_sign} Rising (4-5 paragraphs, ~500 words).
+Include:
+1. How others perceive them
+2. Their public persona
+3. Connect to insecurity with strangers: "{insecurity_with_strangers}"
+4. How it relates to need to be liked: {need_to_be_liked}
+5. Using this Rising energy effectively""",
+    
+    'personality': """Write extensive personality analysis (6-7 paragraphs, ~700 words).
+Analyze EACH of these:
+1. Outlook: {outlook} - how it manifests
+2. Decision Worry: "{decision_worry}" - what this reveals
+3. Need for Approval: {need_to_be_liked} - roots and effects
+4. Social Comfort: "{insecurity_with_strangers}" - connect to Rising
+5. Logic vs Emotions: {logic_vs_emotions}
+6. Dreams: "{life_dreams}"
+7. Motivations: "{motivations}"
+Weave all together into a cohesive portrait.""",
+    
+    'love': """Write comprehensive love analysis (6-7 paragraphs, ~700 words).
+Context:
+- Status: {relationship_status}
+- Goals: {relationship_goals}
+- Unresolved feelings: {unresolved_romantic_feelings}
+Include:
+1. Venus in {venus} - how they love
+2. Mars in {mars} - passion style
+3. Their love language ({love_language}) explained astrologically
+4. Why they overthink ({overthink_relationships})
+5. Desired partner traits: {desired_partner_traits}
+6. Specific guidance for their situation""",
+    
+    'career': """Write career and purpose analysis (6-7 paragraphs, ~700 words).
+Their question: "{career_question}"
+Include:
+1. Midheaven in {midheaven} - career image
+2. {sun_sign} professional strengths
+3. Saturn in {saturn} - lessons
+4. North Node purpose direction
+5. DIRECTLY answer their career question
+6. Connect dreams "{life_dreams}" to career paths""",
+    
+    'forecast': """Write 2026 yearly forecast (6-7 paragraphs, ~700 words).
+Include:
+1. Overall 2026 theme
+2. Major planetary transits
+3. Career and financial outlook
+4. Love predictions
+5. If significant event coming ({significant_life_event_soon}), weave in guidance
+6. Specific month references""",
+    
+    'numerology': """Write numerology analysis (5-6 paragraphs, ~600 words).
+Numbers: Life Path {life_path}, Expression {expression_number}
+Include:
+1. Life Path meaning for them
+2. Expression Number talents
+3. How numbers complement their chart
+4. Personal year number for 2026""",
+    
+    'tarot': """Write tarot section (5-6 paragraphs, ~600 words).
+Include:
+1. Birth cards for Sun ({sun_sign}), Moon ({moon_sign}), Rising ({rising_sign})
+2. What each birth card means
+3. Custom 5-card spread for their goals: {main_goals}
+4. Interpret each card for their situation
+5. Overall message""",
+    
+    'crystals': """Write crystals and rituals section (5-6 paragraphs, ~600 words).
+Include:
+1. 5-7 power crystals for:
+   - Sun in {sun_sign}
+   - Moon in {moon_sign}
+   - Venus in {venus}
+2. Why each resonates with their energy
+3. New moon ritual for {sun_sign}
+4. Full moon ritual for {moon_sign}
+5. Daily grounding practice""",
+    
+    'closing': """Write warm closing (4-5 paragraphs, ~500 words).
+Include:
+1. Summarize their unique cosmic blueprint
+2. Reference their goals ({main_goals})
+3. Acknowledge their journey
+4. If significant event coming, wish them well
+5. Personalized blessing referencing Sun/Moon/Rising""",
+    
+    'important_dates': """They want to know these important dates:
+{important_dates}
+
+Write a section (4-5 paragraphs, ~500 words) addressing EACH date request:
+- Provide specific date ranges or periods in 2026
+- Explain astrological reasoning
+- Give practical advice for these times""",
+}
+
+
+class PromptFields(dict):
+    """Template fields for SECTION_PROMPTS - unanswered questions format as None"""
+    def __missing__(self, key):
+        return None
+
+
+# Placeholder text for sections Claude could not write, filled from the generator (s)
+FALLBACK_TEMPLATES = {
+    'introduction': "Dear {s.first_name}, welcome to your personalized cosmic blueprint...",
+    'sun_sign': "As a {s.sun_sign} Sun, you embody {s.sun_element} energy...",
+    'moon_sign': "Your {s.moon_sign} Moon shapes your emotional world...",
+    'rising_sign': "With {s.rising_sign} Rising, you present yourself with {s.rising_element} energy...",
+    'personality': "Your unique blend of {s.sun_sign}, {s.moon_sign}, and {s.rising_sign} creates a fascinating personality...",
+    'love': "In matters of love, your Venus placement guides your heart...",
+    'career': "Your professional path is illuminated by your natural talents...",
+    'forecast': "2026 brings significant opportunities for growth...",
+    'numerology': "Your Life Path {s.life_path} reveals your soul's journey...",
+    'tarot': "The tarot offers guidance for your path ahead...",
+    'crystals': "Certain crystals resonate with your unique energy...",
+    'important_dates': "Key cosmic dates are highlighted for your journey...",
+    'closing': "Dear {s.first_name}, may the stars guide your journey...",
+}
+
+
+def format_list(items):
+    """Render a questionnaire answer that may be a list"""
+    if isinstance(items, list):
+        return ", ".join(items) if items else "Not specified"
+    return items or "Not specified"
+
+
 class AIContentGenerator:
     """Generate personalized AI content using ALL questionnaire data"""
     
@@ -542,79 +1403,119 @@ class AIContentGenerator:
         self.rising_sign = chart_data.get("rising_sign", "Aries")
         self.life_path = calculate_life_path(user_data.get("birth_date", "2000-01-01"))
         self.expression_number = calculate_expression_number(self.name)
+        
+        # Element and list strings used by the context, looked up once
+        self.sun_element = ZODIAC_DATA.get(self.sun_sign, {}).get('element', '')
+        self.moon_element = ZODIAC_DATA.get(self.moon_sign, {}).get('element', '')
+        self.rising_element = ZODIAC_DATA.get(self.rising_sign, {}).get('element', '')
+        self.list_fields = {key: format_list(user_data.get(key)) for key in LIST_FIELDS}
         self.content = {}
+        
+        # Built here rather than on first use, before any generation threads start
+        self._context = self._build_context()
+        self._system_prompt = self._build_system_prompt()
+        # Identifies this book's saved sections - any change to the user data starts afresh
+        self._progress_key = cache_key(self.name, self._context)
+        self._progress_parts = set()
+        self._failures = 0
+        self._failures_lock = threading.Lock()
+        # Set when any section or batch had to use fallback text
+        self.fallback_used = False
     
     def _build_context(self):
-        """Build comprehensive context string with ALL user data"""
-        def format_list(items):
-            if isinstance(items, list):
-                return ", ".join(items) if items else "Not specified"
-            return items or "Not specified"
-        
-        return f"""
-=== PERSONAL PROFILE ===
-Name: {self.name}
-Gender: {self.user.get('gender', 'Not specified')}
-Birth: {self.user.get('birth_date')} at {self.user.get('birth_time')} {self.user.get('birth_time_period', '')}
-Place: {self.user.get('birth_place')}
-
-=== ASTROLOGICAL CHART ===
-Sun: {self.sun_sign} ({ZODIAC_DATA.get(self.sun_sign, {}).get('element', '')} element)
-Moon: {self.moon_sign} ({ZODIAC_DATA.get(self.moon_sign, {}).get('element', '')} element)
-Rising: {self.rising_sign} ({ZODIAC_DATA.get(self.rising_sign, {}).get('element', '')} element)
-Venus: {self.chart.get('venus', 'Unknown')}
-Mars: {self.chart.get('mars', 'Unknown')}
-Mercury: {self.chart.get('mercury', 'Unknown')}
-Jupiter: {self.chart.get('jupiter', 'Unknown')}
-Saturn: {self.chart.get('saturn', 'Unknown')}
-Midheaven: {self.chart.get('midheaven', 'Unknown')}
-North Node: {self.chart.get('north_node', 'Unknown')}
-
-=== ASTROLOGY KNOWLEDGE ===
-Familiarity: {self.user.get('astrology_familiarity', 'Beginner')}
-
-=== GOALS & MOTIVATIONS ===
-Main Goals: {format_list(self.user.get('main_goals'))}
-Life Dreams: {self.user.get('life_dreams', 'Not specified')}
-Motivations: {self.user.get('motivations', 'Not specified')}
-
-=== RELATIONSHIP STATUS ===
-Status: {self.user.get('relationship_status', 'Not specified')}
-Goals: {format_list(self.user.get('relationship_goals'))}
-Satisfaction: {self.user.get('relationship_satisfaction', 'N/A')}
-Unresolved Feelings: {self.user.get('unresolved_romantic_feelings', 'No')}
-
-=== PERSONALITY ===
-Outlook: {self.user.get('outlook', 'Realist')}
-Decision Worry: {self.user.get('decision_worry', 'Not specified')}
-Need to be Liked: {self.user.get('need_to_be_liked', 'Sometimes')}
-Insecurity with Strangers: {self.user.get('insecurity_with_strangers', 'Not specified')}
-
-=== LOVE & RELATIONSHIPS ===
-Love Language: {self.user.get('love_language', 'Not specified')}
-Logic vs Emotions: {self.user.get('logic_vs_emotions', 'A bit of both')}
-Overthink Relationships: {self.user.get('overthink_relationships', 'Sometimes')}
-Desired Partner Traits: {format_list(self.user.get('desired_partner_traits'))}
-
-=== CAREER ===
-Career Question: {self.user.get('career_question', 'Finding fulfillment')}
-
-=== BOOK PREFERENCES ===
-Birth Chart Includes: {format_list(self.user.get('birth_chart_includes'))}
-Important Dates: {format_list(self.user.get('important_dates'))}
-Additional Topics: {format_list(self.user.get('additional_topics'))}
-
-=== LIFE EVENTS ===
-Significant Event Soon: {self.user.get('significant_life_event_soon', 'No')}
-
-=== NUMEROLOGY ===
-Life Path: {self.life_path}
-Expression Number: {self.expression_number}
-"""
-    
-    def generate_section(self, section_name, prompt, max_tokens=1500):
-        print(f"  Generating: {section_name}...")
+        """Comprehensive context string with ALL user data - shared by every prompt"""
+        get = self.user.get
+        chart = self.chart.get
+        lists = self.list_fields
+        
+        sections = [
+            ("PERSONAL PROFILE", [
+                ("Name", self.name),
+                ("Gender", get('gender', 'Not specified')),
+                ("Birth", f"{get('birth_date')} at {get('birth_time')} {get('birth_time_period', '')}"),
+                ("Place", get('birth_place')),
+            ]),
+            ("ASTROLOGICAL CHART", [
+                ("Sun", f"{self.sun_sign} ({self.sun_element} element)"),
+                ("Moon", f"{self.moon_sign} ({self.moon_element} element)"),
+                ("Rising", f"{self.rising_sign} ({self.rising_element} element)"),
+                ("Venus", chart('venus', 'Unknown')),
+                ("Mars", chart('mars', 'Unknown')),
+                ("Mercury", chart('mercury', 'Unknown')),
+                ("Jupiter", chart('jupiter', 'Unknown')),
+                ("Saturn", chart('saturn', 'Unknown')),
+                ("Midheaven", chart('midheaven', 'Unknown')),
+                ("North Node", chart('north_node', 'Unknown')),
+            ]),
+            ("ASTROLOGY KNOWLEDGE", [
+                ("Familiarity", get('astrology_familiarity', 'Beginner')),
+            ]),
+            ("GOALS & MOTIVATIONS", [
+                ("Main Goals", lists['main_goals']),
+                ("Life Dreams", get('life_dreams', 'Not specified')),
+                ("Motivations", get('motivations', 'Not specified')),
+            ]),
+            ("RELATIONSHIP STATUS", [
+                ("Status", get('relationship_status', 'Not specified')),
+                ("Goals", lists['relationship_goals']),
+                ("Satisfaction", get('relationship_satisfaction', 'N/A')),
+                ("Unresolved Feelings", get('unresolved_romantic_feelings', 'No')),
+            ]),
+            ("PERSONALITY", [
+                ("Outlook", get('outlook', 'Realist')),
+                ("Decision Worry", get('decision_worry', 'Not specified')),
+                ("Need to be Liked", get('need_to_be_liked', 'Sometimes')),
+                ("Insecurity with Strangers", get('insecurity_with_strangers', 'Not specified')),
+            ]),
+            ("LOVE & RELATIONSHIPS", [
+                ("Love Language", get('love_language', 'Not specified')),
+                ("Logic vs Emotions", get('logic_vs_emotions', 'A bit of both')),
+                ("Overthink Relationships", get('overthink_relationships', 'Sometimes')),
+                ("Desired Partner Traits", lists['desired_partner_traits']),
+            ]),
+            ("CAREER", [
+                ("Career Question", get('career_question', 'Finding fulfillment')),
+            ]),
+            ("BOOK PREFERENCES", [
+                ("Birth Chart Includes", lists['birth_chart_includes']),
+                ("Important Dates", lists['important_dates']),
+                ("Additional Topics", lists['additional_topics']),
+            ]),
+            ("LIFE EVENTS", [
+                ("Significant Event Soon", get('significant_life_event_soon', 'No')),
+            ]),
+            ("NUMEROLOGY", [
+                ("Life Path", self.life_path),
+                ("Expression Number", self.expression_number),
+            ]),
+        ]
         
+        lines = [""]
+        for heading, fields in sections:
+            lines.append(f"=== {heading} ===")
+            lines.extend(f"{label}: {value}" for label, value in fields)
+            lines.append("")
+        return "\n".join(lines)
+    
+    def _saved(self, part):
+        """Section content saved by an earlier run for this book, or None (expired entries are deleted)"""
+        if not BOOK_PROGRESS_DIR:
+            return None
+        self._progress_parts.add(part)
+        return cache_get(BOOK_PROGRESS_DIR, cache_key(self._progress_key, part), BOOK_PROGRESS_TTL)
+    
+    def _persist(self, part, value):
+        if BOOK_PROGRESS_DIR:
+            cache_set(BOOK_PROGRESS_DIR, cache_key(self._progress_key, part), value, BOOK_PROGRESS_TTL)
+    
+    def clear_progress(self):
+        """Delete this book's saved sections once it is finished - they only exist to resume a failed run"""
+        if BOOK_PROGRESS_DIR:
+            for part in self._progress_parts:
+                cache_delete(BOOK_PROGRESS_DIR, cache_key(self._progress_key, part))
+    
+    def _build_system_prompt(self):
+        """User context and shared writing rules, sent as the system prompt of every section call"""
         # Determine formatting based on familiarity level
         familiarity = self.user.get('astrology_familiarity', 'Beginner')
         is_beginner = familiarity.lower() in ['beginner', 'new', 'none', 'just starting']
@@ -632,10 +1533,8 @@ FORMATTING REQUIREMENTS:
 - Example: "Your Midheaven (the highest point in your chart, representing career and public image) is in Aries"
 - Keep language accessible and warm, not overly technical"""
         
-        full_prompt = f"""{prompt}
-
-Context:
-{self._build_context()}
+        return f"""Context:
+{self._context}
 
 IMPORTANT: 
 - Write in second person ("you")
@@ -651,170 +1550,138 @@ CRITICAL NARRATIVE RULES:
 - GOOD: 'You tend to feel more reserved in new social situations...'
 - DO NOT start any section with a title like "Analysis for [Name]" or "[Topic] for [Name]"
 - Just dive directly into the content"""
+    
+    def _ask(self, prompt, max_tokens, system_prompt):
+        """call_claude_api, limited to the cache once AI_FAILURE_LIMIT calls in a row have failed"""
+        with self._failures_lock:
+            degraded = self._failures >= AI_FAILURE_LIMIT
+        result = call_claude_api(prompt, max_tokens, cache_only=degraded, system_prompt=system_prompt)
+        if not result:
+            self.fallback_used = True
+        if not degraded:
+            with self._failures_lock:
+                self._failures = 0 if result else self._failures + 1
+                if self._failures == AI_FAILURE_LIMIT:
+                    print(f"⚠️ {AI_FAILURE_LIMIT} AI calls failed in a row - using fallback text for the rest of this book")
+        return result
+    
+    def generate_section(self, section_name, prompt, max_tokens=None):
+        saved = self._saved(section_name)
+        if saved:
+            print(f"  Resumed: {section_name}")
+            self.content[section_name] = saved
+            return saved
         
-        result = call_claude_api(full_prompt, max_tokens)
+        print(f"  Generating: {section_name}...")
+        result = self._ask(prompt, max_tokens or SECTION_MAX_TOKENS.get(section_name, 1500), self._system_prompt)
+        if result:
+            self._persist(section_name, result)
         self.content[section_name] = result or self._get_fallback(section_name)
         return self.content[section_name]
     
+    def generate_section_group(self, group_name, prompts, max_tokens=None):
+        """Generate several sections in one call, split on ===SECTION: name=== markers"""
+        for name, _ in prompts:
+            saved = self._saved(name)
+            if saved:
+                print(f"  Resumed: {name}")
+                self.content[name] = saved
+        prompts = [(name, prompt) for name, prompt in prompts if name not in self.content]
+        if not prompts:
+            return
+        
+        print(f"  Generating: {group_name} ({', '.join(name for name, _ in prompts)})...")
+        
+        parts = [f"""Write the following {len(prompts)} sections. Start each one with its marker line exactly as shown
+(e.g. ===SECTION: {prompts[0][0]}===) and write nothing before the first marker."""]
+        for name, prompt in prompts:
+            parts.append(f"===SECTION: {name}===\n{prompt}")
+        
+        if max_tokens is None:
+            max_tokens = sum(SECTION_MAX_TOKENS.get(name, 1500) for name, _ in prompts)
+        prompt = "\n\n".join(parts)
+        
+        # A group that would overrun the model's limits is split in half rather than truncated
+        if len(prompts) > 1 and (max_tokens > MODEL_MAX_OUTPUT_TOKENS
+                                 or estimate_tokens(prompt + self._system_prompt) + max_tokens > MODEL_CONTEXT_TOKENS):
+            print(f"  {group_name} exceeds model limits, splitting")
+            half = len(prompts) // 2
+            self.generate_section_group(f"{group_name}/1", prompts[:half])
+            self.generate_section_group(f"{group_name}/2", prompts[half:])
+            return
+        
+        result = self._ask(prompt, max_tokens, self._system_prompt)
+        sections = {}
+        if result:
+            pieces = SECTION_MARKER_RE.split(result)
+            sections = {name: text.strip() for name, text in zip(pieces[1::2], pieces[2::2]) if text.strip()}
+        
+        # Anything the model skipped gets its own single-section call (and fallback)
+        for name, prompt in prompts:
+            if name in sections:
+                self._persist(name, sections[name])
+                self.content[name] = sections[name]
+            else:
+                self.generate_section(name, prompt)
+    
     def _get_fallback(self, section):
-        fallbacks = {
-            'introduction': f"Dear {self.first_name}, welcome to your personalized cosmic blueprint...",
-            'sun_sign': f"As a {self.sun_sign} Sun, you embody {ZODIAC_DATA[self.sun_sign]['element']} energy...",
-            'moon_sign': f"Your {self.moon_sign} Moon shapes your emotional world...",
-            'rising_sign': f"With {self.rising_sign} Rising, you present yourself with {ZODIAC_DATA[self.rising_sign]['element']} energy...",
-            'personality': f"Your unique blend of {self.sun_sign}, {self.moon_sign}, and {self.rising_sign} creates a fascinating personality...",
-            'love': f"In matters of love, your Venus placement guides your heart...",
-            'career': f"Your professional path is illuminated by your natural talents...",
-            'forecast': f"2026 brings significant opportunities for growth...",
-            'numerology': f"Your Life Path {self.life_path} reveals your soul's journey...",
-            'tarot': f"The tarot offers guidance for your path ahead...",
-            'crystals': f"Certain crystals resonate with your unique energy...",
-            'important_dates': f"Key cosmic dates are highlighted for your journey...",
-            'closing': f"Dear {self.first_name}, may the stars guide your journey..."
-        }
-        return fallbacks.get(section, "Content for this section...")
+        return FALLBACK_TEMPLATES.get(section, "Content for this section...").format(s=self)
     
     def generate_all(self):
         print(f"\n🌟 Generating AI content for {self.name}...")
         print("=" * 50)
+        if not REPLICATE_API_KEY:
+            print("⚠️ REPLICATE_API_KEY not set - only cached/saved sections, fallback text for the rest")
         
         # Get user's content preferences
         additional_topics = self.user.get('additional_topics', [])
         important_dates = self.user.get('important_dates', [])
         
-        # Core sections with enhanced prompts using ALL data
-        sections = [
-            ('introduction', f"""Write a warm, personalized introduction (4-5 paragraphs, ~500 words).
-Include:
-1. Welcome them by name ({self.first_name})
-2. Reference their specific main goals: {self.user.get('main_goals')}
-3. Acknowledge their astrology knowledge level ({self.user.get('astrology_familiarity')})
-4. Mention if they have a significant life event coming: {self.user.get('significant_life_event_soon')}
-5. Make them feel this book was written just for them"""),
-            
-            ('sun_sign', f"""Write comprehensive {self.sun_sign} Sun analysis (5-6 paragraphs, ~600 words).
-Include:
-1. The essence of {self.sun_sign} energy
-2. How it connects to their outlook: {self.user.get('outlook')}
-3. How their dreams ("{self.user.get('life_dreams')}") align with {self.sun_sign} traits
-4. {self.sun_sign} strengths and shadows
-5. How it interacts with their {self.moon_sign} Moon and {self.rising_sign} Rising"""),
-            
-            ('moon_sign', f"""Write deep {self.moon_sign} Moon analysis (5-6 paragraphs, ~600 words).
-Include:
-1. Their emotional nature as a {self.moon_sign} Moon
-2. What they need to feel secure
-3. How they process emotions - connect to: {self.user.get('logic_vs_emotions')}
-4. Their tendency to overthink: {self.user.get('overthink_relationships')}
-5. How {self.moon_sign} Moon shapes their love language: {self.user.get('love_language')}"""),
-            
-            ('rising_sign', f"""Write about {self.rising_sign} Rising (4-5 paragraphs, ~500 words).
-Include:
-1. How others perceive them
-2. Their public persona
-3. Connect to insecurity with strangers: "{self.user.get('insecurity_with_strangers')}"
-4. How it relates to need to be liked: {self.user.get('need_to_be_liked')}
-5. Using this Rising energy effectively"""),
-            
-            ('personality', f"""Write extensive personality analysis (6-7 paragraphs, ~700 words).
-Analyze EACH of these:
-1. Outlook: {self.user.get('outlook')} - how it manifests
-2. Decision Worry: "{self.user.get('decision_worry')}" - what this reveals
-3. Need for Approval: {self.user.get('need_to_be_liked')} - roots and effects
-4. Social Comfort: "{self.user.get('insecurity_with_strangers')}" - connect to Rising
-5. Logic vs Emotions: {self.user.get('logic_vs_emotions')}
-6. Dreams: "{self.user.get('life_dreams')}"
-7. Motivations: "{self.user.get('motivations')}"
-Weave all together into a cohesive portrait."""),
-            
-            ('love', f"""Write comprehensive love analysis (6-7 paragraphs, ~700 words).
-Context:
-- Status: {self.user.get('relationship_status')}
-- Goals: {self.user.get('relationship_goals')}
-- Unresolved feelings: {self.user.get('unresolved_romantic_feelings')}
-Include:
-1. Venus in {self.chart.get('venus', 'Unknown')} - how they love
-2. Mars in {self.chart.get('mars', 'Unknown')} - passion style
-3. Their love language ({self.user.get('love_language')}) explained astrologically
-4. Why they overthink ({self.user.get('overthink_relationships')})
-5. Desired partner traits: {self.user.get('desired_partner_traits')}
-6. Specific guidance for their situation"""),
-            
-            ('career', f"""Write career and purpose analysis (6-7 paragraphs, ~700 words).
-Their question: "{self.user.get('career_question')}"
-Include:
-1. Midheaven in {self.chart.get('midheaven', 'Unknown')} - career image
-2. {self.sun_sign} professional strengths
-3. Saturn in {self.chart.get('saturn', 'Unknown')} - lessons
-4. North Node purpose direction
-5. DIRECTLY answer their career question
-6. Connect dreams "{self.user.get('life_dreams')}" to career paths"""),
-            
-            ('forecast', f"""Write 2026 yearly forecast (6-7 paragraphs, ~700 words).
-Include:
-1. Overall 2026 theme
-2. Major planetary transits
-3. Career and financial outlook
-4. Love predictions
-5. If significant event coming ({self.user.get('significant_life_event_soon')}), weave in guidance
-6. Specific month references"""),
-            
-            ('numerology', f"""Write numerology analysis (5-6 paragraphs, ~600 words).
-Numbers: Life Path {self.life_path}, Expression {self.expression_number}
-Include:
-1. Life Path meaning for them
-2. Expression Number talents
-3. How numbers complement their chart
-4. Personal year number for 2026"""),
-            
-            ('tarot', f"""Write tarot section (5-6 paragraphs, ~600 words).
-Include:
-1. Birth cards for Sun ({self.sun_sign}), Moon ({self.moon_sign}), Rising ({self.rising_sign})
-2. What each birth card means
-3. Custom 5-card spread for their goals: {self.user.get('main_goals')}
-4. Interpret each card for their situation
-5. Overall message"""),
-            
-            ('crystals', f"""Write crystals and rituals section (5-6 paragraphs, ~600 words).
-Include:
-1. 5-7 power crystals for:
-   - Sun in {self.sun_sign}
-   - Moon in {self.moon_sign}
-   - Venus in {self.chart.get('venus', 'Unknown')}
-2. Why each resonates with their energy
-3. New moon ritual for {self.sun_sign}
-4. Full moon ritual for {self.moon_sign}
-5. Daily grounding practice"""),
-            
-            ('closing', f"""Write warm closing (4-5 paragraphs, ~500 words).
-Include:
-1. Summarize their unique cosmic blueprint
-2. Reference their goals ({self.user.get('main_goals')})
-3. Acknowledge their journey
-4. If significant event coming, wish them well
-5. Personalized blessing referencing Sun/Moon/Rising"""),
-        ]
-        
-        for section_name, prompt in sections:
-            self.generate_section(section_name, prompt)
-        
-        # Important dates section (if user selected any)
-        if important_dates:
-            self.generate_section('important_dates', f"""They want to know these important dates:
-{important_dates}
-
-Write a section (4-5 paragraphs, ~500 words) addressing EACH date request:
-- Provide specific date ranges or periods in 2026
-- Explain astrological reasoning
-- Give practical advice for these times""")
+        # Core sections with enhanced prompts using ALL data; important dates only if the user selected any
+        fields = PromptFields(self.user)
+        fields.update(
+            first_name=self.first_name, sun_sign=self.sun_sign, moon_sign=self.moon_sign,
+            rising_sign=self.rising_sign, life_path=self.life_path, expression_number=self.expression_number,
+            **{planet: self.chart.get(planet, 'Unknown') for planet in ('venus', 'mars', 'midheaven', 'saturn')}
+        )
+        sections = [(name, template.format_map(fields)) for name, template in SECTION_PROMPTS.items()
+                    if name != 'important_dates' or important_dates]
+        
+        # Start from fallbacks; each batch overwrites the entries it managed to parse
+        self.content['compatibility'] = {
+            sign: {'text': f"{self.sun_sign} and {sign} create a unique dynamic...", 'percentage': 70}
+            for sign in ZODIAC_ORDER
+        }
+        self.content['monthly'] = {month: f"{month} 2026 brings transformation and growth..." for month in MONTHS}
+        
+        # Every section and batch is an independent Replicate prediction - run them
+        # all concurrently, bounded so we stay inside the API rate limit
+        prompts = dict(sections)
+        grouped = {name for members in SECTION_GROUPS.values() for name in members}
+        
+        with ThreadPoolExecutor(max_workers=AI_MAX_WORKERS) as executor:
+            futures = [executor.submit(self.generate_section_group, group_name, [(name, prompts[name]) for name in members])
+                       for group_name, members in SECTION_GROUPS.items()]
+            futures += [executor.submit(self.generate_section, name, prompt) for name, prompt in sections if name not in grouped]
+            futures += [executor.submit(self.generate_compat_batch, ZODIAC_ORDER[i:i+6]) for i in (0, 6)]
+            futures += [executor.submit(self.generate_monthly_batch, MONTHS[i:i+6]) for i in (0, 6)]
+            for future in futures:
+                future.result()
         
-        # Batch compatibility
-        print("  Generating: compatibility (batched)...")
-        self.content['compatibility'] = {}
+        print("=" * 50)
+        print("✅ All AI content generated!")
+        return self.content
+    
+    def generate_compat_batch(self, signs_batch):
+        progress = f"compatibility:{signs_batch[0]}"
+        saved = self._saved(progress)
+        if saved:
+            print(f"  Resumed: compatibility {signs_batch[0]}-{signs_batch[-1]}")
+            self.content['compatibility'].update(saved)
+            return
         
-        for batch_start in [0, 6]:
-            signs_batch = ZODIAC_ORDER[batch_start:batch_start+6]
-            prompt = f"""Write compatibility for {self.sun_sign} with: {', '.join(signs_batch)}.
+        print(f"  Generating: compatibility {signs_batch[0]}-{signs_batch[-1]} (batched)...")
+        prompt = f"""Write compatibility for {self.sun_sign} with: {', '.join(signs_batch)}.
 
 Consider their desired partner traits: {self.user.get('desired_partner_traits')}
 
@@ -830,28 +1697,24 @@ PERCENTAGE: XX%
 PERCENTAGE: XX%
 
 (continue for all 6 signs)"""
-            
-            result = call_claude_api(f"{prompt}\n\n{self._build_context()}", max_tokens=2500)
-            if result:
-                self._parse_compat(result, signs_batch)
         
-        for sign in ZODIAC_ORDER:
-            if sign not in self.content['compatibility']:
-                self.content['compatibility'][sign] = {
-                    'text': f"{self.sun_sign} and {sign} create a unique dynamic...",
-                    'percentage': 70
-                }
-        
-        # Batch monthly
-        print("  Generating: monthly forecasts (batched)...")
-        self.content['monthly'] = {}
-        
-        all_months = ["January", "February", "March", "April", "May", "June",
-                      "July", "August", "September", "October", "November", "December"]
+        result = self._ask(prompt, BATCH_MAX_TOKENS, self._context.strip())
+        if result:
+            parsed = self._parse_compat(result, signs_batch)
+            self.content['compatibility'].update(parsed)
+            self.fallback_used |= len(parsed) < len(signs_batch)
+            self._persist(progress, parsed)
+    
+    def generate_monthly_batch(self, months_batch):
+        progress = f"monthly:{months_batch[0]}"
+        saved = self._saved(progress)
+        if saved:
+            print(f"  Resumed: monthly forecasts {months_batch[0]}-{months_batch[-1]}")
+            self.content['monthly'].update(saved)
+            return
         
-        for batch_start in [0, 6]:
-            months_batch = all_months[batch_start:batch_start+6]
-            prompt = f"""Write 2026 monthly forecasts for: {', '.join(months_batch)}.
+        print(f"  Generating: monthly forecasts {months_batch[0]}-{months_batch[-1]} (batched)...")
+        prompt = f"""Write 2026 monthly forecasts for: {', '.join(months_batch)}.
 
 Consider their goals: {self.user.get('main_goals')}
 Relationship status: {self.user.get('relationship_status')}
@@ -866,60 +1729,154 @@ Format:
 [content]
 
 (continue for all 6 months)"""
-            
-            result = call_claude_api(f"{prompt}\n\n{self._build_context()}", max_tokens=2500)
-            if result:
-                self._parse_monthly(result, months_batch)
         
-        for month in all_months:
-            if month not in self.content['monthly']:
-                self.content['monthly'][month] = f"{month} 2026 brings transformation and growth..."
-        
-        print("=" * 50)
-        print("✅ All AI content generated!")
-        return self.content
+        result = self._ask(prompt, BATCH_MAX_TOKENS, self._context.strip())
+        if result:
+            parsed = self._parse_monthly(result, months_batch)
+            self.content['monthly'].update(parsed)
+            self.fallback_used |= len(parsed) < len(months_batch)
+            self._persist(progress, parsed)
+    
+    @staticmethod
+    def _split_sections(pattern, text):
+        """Map each heading matched by `pattern` to the text up to the next heading (first occurrence wins)"""
+        parts = pattern.split(text)
+        sections = {}
+        for i in range(1, len(parts) - 1, 2):
+            sections.setdefault(parts[i].capitalize(), parts[i + 1])
+        return sections
     
     def _parse_compat(self, text, signs):
-        import re
+        """{sign: {'text', 'percentage'}} for each sign of the batch found in the response"""
+        sections = self._split_sections(SIGN_SPLIT, text)
+        parsed = {}
         for sign in signs:
-            pattern = rf'{sign.upper()}:\s*(.*?)(?=PERCENTAGE:\s*(\d+))'
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+            body = sections.get(sign)
+            if body is None:
+                continue
+            match = PERCENTAGE_RE.search(body)
             if match:
-                content = match.group(1).strip()
-                percentage = int(match.group(2)) if match.group(2) else 70
-                self.content['compatibility'][sign] = {
-                    'text': content,
-                    'percentage': percentage
-                }
+                content = body[:match.start()].strip()
+                percentage = int(match.group(1))
             else:
-                simple_pattern = rf'{sign.upper()}:\s*(.*?)(?=(?:ARIES|TAURUS|GEMINI|CANCER|LEO|VIRGO|LIBRA|SCORPIO|SAGITTARIUS|CAPRICORN|AQUARIUS|PISCES):|\Z)'
-                simple_match = re.search(simple_pattern, text, re.DOTALL | re.IGNORECASE)
-                if simple_match:
-                    content = simple_match.group(1).strip()
-                    pct_match = re.search(r'(\d+)%', content)
-                    percentage = int(pct_match.group(1)) if pct_match else 70
-                    self.content['compatibility'][sign] = {
-                        'text': content,
-                        'percentage': percentage
-                    }
+                content = body.strip()
+                pct_match = PERCENT_RE.search(content)
+                percentage = int(pct_match.group(1)) if pct_match else 70
+            parsed[sign] = {
+                'text': content,
+                'percentage': percentage
+            }
+        return parsed
     
     def _parse_monthly(self, text, months):
-        import re
-        for month in months:
-            pattern = rf'{month.upper()}:\s*(.*?)(?=(?:JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER):|\Z)'
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                self.content['monthly'][month] = match.group(1).strip()
+        """{month: text} for each month of the batch found in the response"""
+        sections = self._split_sections(MONTH_SPLIT, text)
+        return {month: sections[month].strip() for month in months if month in sections}
 
 
 # ============================================================
 # PDF BOOK GENERATOR
 # ============================================================
 
+@lru_cache(maxsize=16384)
+def word_width(word, font_name, font_size):
+    """Cached pdfmetrics.stringWidth - book text, headings and ornaments reuse the same strings heavily"""
+    return pdfmetrics.stringWidth(word, font_name, font_size)
+
+
+def wrap_to_width(text, font_name, font_size, max_width):
+    """Greedy word wrap into lines no wider than max_width points in the given font"""
+    space = word_width(' ', font_name, font_size)
+    lines = []
+    current = []
+    current_width = 0
+    for word in text.split():
+        w = word_width(word, font_name, font_size)
+        
+        # Hard-break words that cannot fit on a line of their own
+        while w > max_width and len(word) > 1:
+            if current:
+                lines.append(' '.join(current))
+                current, current_width = [], 0
+            cut = len(word) - 1
+            while cut > 1 and pdfmetrics.stringWidth(word[:cut], font_name, font_size) > max_width:
+                cut -= 1
+            lines.append(word[:cut])
+            word = word[cut:]
+            w = word_width(word, font_name, font_size)
+        
+        if current and current_width + space + w > max_width:
+            lines.append(' '.join(current))
+            current, current_width = [], 0
+        current_width += (space if current else 0) + w
+        current.append(word)
+    if current:
+        lines.append(' '.join(current))
+    return lines
+
+
+# Upsell page image - fetched once, downsampled to print resolution for its slot on
+# the page and kept on disk, so books don't each download and re-encode the original
+PROMO_IMAGE_URL = "https://f005.backblazeb2.com/file/publicorastria/book-last-page-image.png"
+PROMO_IMAGE_DPI = 150
+PROMO_IMAGE_TTL = 7 * 86400
+PROMO_IMAGES = {}
+
+
+def promo_image(width, height):
+    """ImageReader for the promo image fitted to width x height points, or None if unavailable"""
+    size = (round(width / 72 * PROMO_IMAGE_DPI), round(height / 72 * PROMO_IMAGE_DPI))
+    if size in PROMO_IMAGES:
+        return PROMO_IMAGES[size]
+    
+    path = os.path.join(tempfile.gettempdir(), f"orastria_promo_{size[0]}x{size[1]}.png")
+    tmp_name = None
+    try:
+        if not os.path.exists(path) or time.time() - os.path.getmtime(path) > PROMO_IMAGE_TTL:
+            from PIL import Image
+            import io
+            
+            response = requests.get(PROMO_IMAGE_URL, timeout=15)
+            response.raise_for_status()
+            image = Image.open(io.BytesIO(response.content))
+            image.thumbnail(size, Image.LANCZOS)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), suffix='.tmp', delete=False) as tmp:
+                tmp_name = tmp.name
+                image.save(tmp, format='PNG', optimize=True)
+            os.replace(tmp_name, path)
+        # Failures aren't remembered, so the next book tries again
+        PROMO_IMAGES[size] = ImageReader(path)
+        return PROMO_IMAGES[size]
+    except Exception as e:
+        print(f"⚠️ Could not load promo image: {e}")
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        return None
+
+
+def optimize_pdf(path):
+    """Linearize the PDF and pack its objects into streams in place, if pikepdf is installed"""
+    try:
+        import pikepdf
+    except ImportError:
+        return
+    try:
+        with pikepdf.open(path, allow_overwriting_input=True) as pdf:
+            pdf.save(path, linearize=True, compress_streams=True,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate)
+    except Exception as e:
+        print(f"⚠️ PDF optimization skipped: {e}")
+
+
 class OrastriaVisualBook:
     """Generate beautiful PDF book"""
     
     def __init__(self, user_data, chart_data, ai_content, output_path):
+        setup_fonts()
+        
         self.user = user_data
         self.chart = chart_data
         self.content = ai_content
@@ -927,8 +1884,12 @@ class OrastriaVisualBook:
         
         self.width, self.height = letter
         self.margin = 0.75 * inch
+        self.text_width = self.width - 2 * self.margin
         self.page_num = 0
-        self.c = canvas.Canvas(output_path, pagesize=letter)
+        # Written beside output_path and renamed into place by build(), so a crash
+        # never leaves a truncated PDF where callers (and the book cache) expect one
+        self.partial_path = f"{output_path}.partial"
+        self.c = canvas.Canvas(self.partial_path, pagesize=letter, pageCompression=1, invariant=1)
         
         # Handle both 'name' and 'first_name' fields
         self.name = user_data.get("name") or f"{user_data.get('first_name', '')} {user_data.get('last_name', '')}".strip() or "Friend"
@@ -937,6 +1898,8 @@ class OrastriaVisualBook:
         self.sun_sign = chart_data.get("sun_sign", "Aries")
         self.moon_sign = chart_data.get("moon_sign", "Aries")
         self.rising_sign = chart_data.get("rising_sign", "Aries")
+        self.sun_symbol = ZODIAC_SYMBOLS.get(self.sun_sign, '★')
+        self.sun_data = ZODIAC_DATA.get(self.sun_sign, {})
         
         # Get color theme
         color_choice = user_data.get('book_color', 'navy').lower()
@@ -946,12 +1909,10 @@ class OrastriaVisualBook:
         
         # Parse birth date
         bd = user_data.get("birth_date", "2000-01-01")
-        if "-" in bd:
-            parts = bd.split("-")
-            months = ["", "January", "February", "March", "April", "May", "June",
-                      "July", "August", "September", "October", "November", "December"]
-            self.birth_date_formatted = f"{months[int(parts[1])]} {int(parts[2])}, {parts[0]}"
-        else:
+        try:
+            dt = datetime.strptime(bd, "%Y-%m-%d")
+            self.birth_date_formatted = f"{dt:%B} {dt.day}, {dt.year}"
+        except ValueError:
             self.birth_date_formatted = bd
     
     def get_compat_color(self, percentage):
@@ -964,71 +1925,83 @@ class OrastriaVisualBook:
             return ORANGE
         else:
             return RED
+
+    def _set_font(self, name, size):
+        """Set the canvas font unless it is already active"""
+        # The canvas tracks its own font/fill state and resets it on showPage,
+        # so direct canvas calls and page breaks can never leave us stale
+        c = self.c
+        if c._fontname != name or c._fontsize != size:
+            c.setFont(name, size)
+
+    def _set_fill(self, color):
+        """Set the canvas fill color unless it is already active"""
+        c = self.c
+        if c._fillColorObj != color:
+            c.setFillColor(color)
+
+    def _draw_centred(self, x, y, text):
+        """c.drawCentredString, measuring through the shared width cache"""
+        c = self.c
+        c.drawString(x - 0.5 * word_width(text, c._fontname, c._fontsize), y, text)
     
     def draw_cover(self):
         """Draw beautiful cover"""
         c = self.c
+        center_y = self.height / 2 - 0.3*inch
         
-        c.setFillColor(self.primary_color)
+        self._set_fill(self.primary_color)
         c.rect(0, 0, self.width, self.height, fill=1, stroke=0)
         
+        # Nothing on the cover overlaps, so draw it grouped by stroke width and
+        # fill colour rather than top to bottom - three fill changes instead of eight
         c.setStrokeColor(self.accent_color)
         c.setLineWidth(2)
         c.rect(0.4*inch, 0.4*inch, self.width - 0.8*inch, self.height - 0.8*inch)
+        c.circle(self.width/2, center_y, 85)
         c.setLineWidth(1)
         c.rect(0.5*inch, 0.5*inch, self.width - 1*inch, self.height - 1*inch)
+        c.line(2*inch, self.height - 2.55*inch, self.width - 2*inch, self.height - 2.55*inch)
+        c.circle(self.width/2, center_y, 95)
         
-        c.setFont(FONT_SYMBOL_BOLD, 24)
-        c.setFillColor(self.accent_color)
-        c.drawCentredString(0.8*inch, self.height - 0.8*inch, '☉')
-        c.drawCentredString(self.width - 0.8*inch, self.height - 0.8*inch, '☽')
+        self._set_fill(self.accent_color)
+        self._set_font(FONT_SYMBOL_BOLD, 24)
+        self._draw_centred(0.8*inch, self.height - 0.8*inch, '☉')
+        self._draw_centred(self.width - 0.8*inch, self.height - 0.8*inch, '☽')
         
-        c.setFont(FONT_HEADING_BOLD, 36)
-        c.drawCentredString(self.width/2, self.height - 1.8*inch, "YOUR COSMIC")
-        c.drawCentredString(self.width/2, self.height - 2.3*inch, "BLUEPRINT")
+        self._set_font(FONT_HEADING_BOLD, 36)
+        self._draw_centred(self.width/2, self.height - 1.8*inch, "YOUR COSMIC")
+        self._draw_centred(self.width/2, self.height - 2.3*inch, "BLUEPRINT")
         
-        c.setLineWidth(1)
-        c.line(2*inch, self.height - 2.55*inch, self.width - 2*inch, self.height - 2.55*inch)
+        self._set_font(FONT_SYMBOL_BOLD, 72)
+        self._draw_centred(self.width/2, center_y - 15, self.sun_symbol)
         
-        c.setFillColor(white)
-        c.setFont(FONT_HEADING_BOLD, 28)
-        c.drawCentredString(self.width/2, self.height - 3.2*inch, self.name)
+        self._set_font(FONT_HEADING_BOLD, 18)
+        self._draw_centred(self.width/2, center_y - 60, self.sun_sign.upper())
         
-        c.setFillColor(SOFT_GOLD)
-        c.setFont(FONT_BODY, 12)
-        birth_time = f"{self.user.get('birth_time', '')} {self.user.get('birth_time_period', '')}".strip()
-        c.drawCentredString(self.width/2, self.height - 3.6*inch, f"{self.birth_date_formatted}  •  {birth_time}")
-        c.drawCentredString(self.width/2, self.height - 3.85*inch, self.user.get('birth_place', ''))
+        self._set_font(FONT_HEADING_BOLD, 22)
+        self._draw_centred(self.width/2, 1.3*inch, "ORASTRIA")
         
-        center_y = self.height / 2 - 0.3*inch
-        c.setStrokeColor(self.accent_color)
-        c.setLineWidth(2)
-        c.circle(self.width/2, center_y, 85)
-        c.setLineWidth(1)
-        c.circle(self.width/2, center_y, 95)
+        self._set_font(FONT_BODY, 10)
+        self._draw_centred(self.width/2, 1*inch, "Personalized Astrology  •  Written in the Stars")
         
-        c.setFillColor(self.accent_color)
-        c.setFont(FONT_SYMBOL_BOLD, 72)
-        c.drawCentredString(self.width/2, center_y - 15, ZODIAC_SYMBOLS.get(self.sun_sign, '★'))
+        self._set_font(FONT_SYMBOL, 16)
+        self._draw_centred(0.8*inch, 0.8*inch, '☽')
+        self._draw_centred(self.width - 0.8*inch, 0.8*inch, '☽')
         
-        c.setFont(FONT_HEADING_BOLD, 18)
-        c.drawCentredString(self.width/2, center_y - 60, self.sun_sign.upper())
+        self._set_fill(white)
+        self._set_font(FONT_HEADING_BOLD, 28)
+        self._draw_centred(self.width/2, self.height - 3.2*inch, self.name)
         
-        c.setFont(FONT_SYMBOL, 11)
-        c.setFillColor(white)
+        self._set_font(FONT_SYMBOL, 11)
         big_three = f"☉ Sun: {self.sun_sign}  •  ☽ Moon: {self.moon_sign}  •  ↑ Rising: {self.rising_sign}"
-        c.drawCentredString(self.width/2, center_y - 115, big_three)
-        
-        c.setFillColor(self.accent_color)
-        c.setFont(FONT_HEADING_BOLD, 22)
-        c.drawCentredString(self.width/2, 1.3*inch, "ORASTRIA")
+        self._draw_centred(self.width/2, center_y - 115, big_three)
         
-        c.setFont(FONT_BODY, 10)
-        c.drawCentredString(self.width/2, 1*inch, "Personalized Astrology  •  Written in the Stars")
-        
-        c.setFont(FONT_SYMBOL, 16)
-        c.drawCentredString(0.8*inch, 0.8*inch, '☽')
-        c.drawCentredString(self.width - 0.8*inch, 0.8*inch, '☽')
+        self._set_fill(SOFT_GOLD)
+        self._set_font(FONT_BODY, 12)
+        birth_time = f"{self.user.get('birth_time', '')} {self.user.get('birth_time_period', '')}".strip()
+        self._draw_centred(self.width/2, self.height - 3.6*inch, f"{self.birth_date_formatted}  •  {birth_time}")
+        self._draw_centred(self.width/2, self.height - 3.85*inch, self.user.get('birth_place', ''))
         
         c.showPage()
     
@@ -1037,22 +2010,34 @@ class OrastriaVisualBook:
         self.page_num += 1
         c = self.c
         
-        c.setFillColor(CREAM)
-        c.rect(0, 0, self.width, self.height, fill=True, stroke=False)
-        
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL, 10)
-        c.drawCentredString(50, self.height - 50, '✦')
-        c.drawCentredString(self.width - 50, self.height - 50, '✦')
-        c.drawCentredString(50, 50, '✦')
-        c.drawCentredString(self.width - 50, 50, '✦')
+        # Background and corner stars are the same on every page - one form, many pages
+        if not c.hasForm('page_background'):
+            self.draw_page_background_form()
+        c.doForm('page_background')
         
-        c.setFillColor(NAVY)
-        c.setFont(FONT_BODY, 10)
-        c.drawCentredString(self.width/2, 30, f"— {self.page_num} —")
+        self._set_fill(NAVY)
+        self._set_font(FONT_BODY, 10)
+        self._draw_centred(self.width/2, 30, f"— {self.page_num} —")
         
         return self.height - 80
     
+    def draw_page_background_form(self):
+        """Draw the cream page background and corner stars into the 'page_background' form"""
+        c = self.c
+        c.beginForm('page_background')
+        
+        self._set_fill(CREAM)
+        c.rect(0, 0, self.width, self.height, fill=True, stroke=False)
+        
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL, 10)
+        self._draw_centred(50, self.height - 50, '✦')
+        self._draw_centred(self.width - 50, self.height - 50, '✦')
+        self._draw_centred(50, 50, '✦')
+        self._draw_centred(self.width - 50, 50, '✦')
+        
+        c.endForm()
+    
     def draw_chapter(self, title, subtitle=None, icon=None):
         """Draw chapter title page with optional icon"""
         y = self.new_page()
@@ -1080,49 +2065,48 @@ class OrastriaVisualBook:
         display_icon = icon or chapter_icons.get(title, "✧")
         
         # Large decorative icon
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL_BOLD, 48)
-        c.drawCentredString(self.width/2, self.height - 180, display_icon)
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL_BOLD, 48)
+        self._draw_centred(self.width/2, self.height - 180, display_icon)
         
-        # Decorative line
-        c.setStrokeColor(GOLD)
-        c.setLineWidth(1)
-        c.line(self.width/2 - 60, self.height - 220, self.width/2 + 60, self.height - 220)
+        # Divider and bottom ornament are identical on every chapter page
+        if not c.hasForm('chapter_ornament'):
+            self.draw_chapter_ornament_form()
+        c.doForm('chapter_ornament')
         
         # Title
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 32)
-        c.drawCentredString(self.width/2, self.height - 280, title)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 32)
+        self._draw_centred(self.width/2, self.height - 280, title)
         
         if subtitle:
-            c.setFillColor(SOFT_GOLD)
-            c.setFont(FONT_BODY_ITALIC, 16)
-            c.drawCentredString(self.width/2, self.height - 320, subtitle)
-        
-        # Bottom decorative element
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL, 14)
-        c.drawCentredString(self.width/2, self.height - 380, "✧  ✦  ✧")
+            self._set_fill(SOFT_GOLD)
+            self._set_font(FONT_BODY_ITALIC, 16)
+            self._draw_centred(self.width/2, self.height - 320, subtitle)
         
         c.showPage()
     
-    def draw_birth_chart_wheel(self):
-        """Draw a visual birth chart wheel diagram"""
-        y = self.new_page()
+    def draw_chapter_ornament_form(self):
+        """Draw the chapter page divider and bottom ornament into the 'chapter_ornament' form"""
         c = self.c
+        c.beginForm('chapter_ornament')
         
-        # Title
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 24)
-        c.drawCentredString(self.width/2, self.height - 100, "Your Birth Chart")
+        # Decorative line
+        c.setStrokeColor(GOLD)
+        c.setLineWidth(1)
+        c.line(self.width/2 - 60, self.height - 220, self.width/2 + 60, self.height - 220)
         
-        c.setFillColor(HexColor('#666666'))
-        c.setFont(FONT_BODY_ITALIC, 12)
-        c.drawCentredString(self.width/2, self.height - 125, "A snapshot of the heavens at the moment you were born")
+        # Bottom decorative element
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL, 14)
+        self._draw_centred(self.width/2, self.height - 380, "✧  ✦  ✧")
         
-        # Chart wheel center
-        center_x = self.width / 2
-        center_y = self.height / 2 + 0.5*inch
+        c.endForm()
+    
+    def draw_wheel_form(self, center_x, center_y):
+        """Draw the book-independent part of the chart wheel into the 'wheel_static' form"""
+        c = self.c
+        c.beginForm('wheel_static')
         
         # Draw outer ring (houses)
         c.setStrokeColor(NAVY)
@@ -1133,37 +2117,21 @@ class OrastriaVisualBook:
         c.circle(center_x, center_y, 60)
         
         # Draw house lines
-        c.setStrokeColor(HexColor('#cccccc'))
+        c.setStrokeColor(RULE_GRAY)
         c.setLineWidth(0.5)
-        for i in range(12):
-            angle = (90 - i * 30) * math.pi / 180
-            x1 = center_x + 60 * math.cos(angle)
-            y1 = center_y + 60 * math.sin(angle)
-            x2 = center_x + 140 * math.cos(angle)
-            y2 = center_y + 140 * math.sin(angle)
-            c.line(x1, y1, x2, y2)
-        
-        # Draw zodiac signs around wheel
-        for i, sign in enumerate(ZODIAC_ORDER):
-            angle = (75 - i * 30) * math.pi / 180
-            x = center_x + 125 * math.cos(angle)
-            y = center_y + 125 * math.sin(angle)
-            
-            # Highlight user's signs
-            if sign == self.sun_sign:
-                c.setFillColor(GOLD)
-            elif sign == self.moon_sign:
-                c.setFillColor(HexColor('#8899AA'))
-            elif sign == self.rising_sign:
-                c.setFillColor(HexColor('#AA7755'))
-            else:
-                c.setFillColor(NAVY)
-            
-            c.setFont(FONT_SYMBOL_BOLD, 14)
-            c.drawCentredString(x, y - 5, ZODIAC_SYMBOLS.get(sign, '★'))
+        for cos_a, sin_a in WHEEL_HOUSE_POINTS:
+            c.line(center_x + 60 * cos_a, center_y + 60 * sin_a,
+                   center_x + 140 * cos_a, center_y + 140 * sin_a)
+        
+        # Draw zodiac signs around wheel in the default color
+        self._set_fill(NAVY)
+        self._set_font(FONT_SYMBOL_BOLD, 14)
+        for sign in ZODIAC_ORDER:
+            cos_a, sin_a = WHEEL_SIGN_POINTS[sign]
+            self._draw_centred(center_x + 125 * cos_a, center_y + 125 * sin_a - 5, ZODIAC_SYMBOLS[sign])
         
         # Center circle background
-        c.setFillColor(HexColor('#faf8f5'))
+        self._set_fill(WHEEL_CENTER)
         c.circle(center_x, center_y, 55, fill=1, stroke=0)
         
         # Inner decorative ring
@@ -1175,33 +2143,72 @@ class OrastriaVisualBook:
         c.setStrokeColor(GOLD)
         c.setLineWidth(1.5)
         c.circle(center_x - 18, center_y + 8, 14, fill=0, stroke=1)
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL_BOLD, 18)
-        c.drawCentredString(center_x - 18, center_y + 3, '☉')
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL_BOLD, 18)
+        self._draw_centred(center_x - 18, center_y + 3, '☉')
         
         # Moon symbol with ring
-        c.setStrokeColor(HexColor('#7788AA'))
+        c.setStrokeColor(MOON_BLUE)
         c.setLineWidth(1.5)
         c.circle(center_x + 18, center_y + 8, 14, fill=0, stroke=1)
-        c.setFillColor(HexColor('#7788AA'))
-        c.setFont(FONT_SYMBOL_BOLD, 18)
-        c.drawCentredString(center_x + 18, center_y + 3, '☽')
+        self._set_fill(MOON_BLUE)
+        self._set_font(FONT_SYMBOL_BOLD, 18)
+        self._draw_centred(center_x + 18, center_y + 3, '☽')
+        
+        c.endForm()
+    
+    def draw_birth_chart_wheel(self):
+        """Draw a visual birth chart wheel diagram"""
+        y = self.new_page()
+        c = self.c
+        
+        # Title
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 24)
+        self._draw_centred(self.width/2, self.height - 100, "Your Birth Chart")
+        
+        self._set_fill(MID_GRAY)
+        self._set_font(FONT_BODY_ITALIC, 12)
+        self._draw_centred(self.width/2, self.height - 125, "A snapshot of the heavens at the moment you were born")
+        
+        # Chart wheel center
+        center_x = self.width / 2
+        center_y = self.height / 2 + 0.5*inch
+        
+        # Static wheel is identical in every book - draw it once as a form
+        if not c.hasForm('wheel_static'):
+            self.draw_wheel_form(center_x, center_y)
+        c.doForm('wheel_static')
+        
+        # Highlight user's signs over the default glyphs (Sun wins over Moon over Rising)
+        highlights = {
+            self.rising_sign: RISING_HIGHLIGHT,
+            self.moon_sign: MOON_HIGHLIGHT,
+            self.sun_sign: GOLD,
+        }
+        self._set_font(FONT_SYMBOL_BOLD, 14)
+        for sign, color in highlights.items():
+            if sign not in WHEEL_SIGN_POINTS:
+                continue
+            cos_a, sin_a = WHEEL_SIGN_POINTS[sign]
+            self._set_fill(color)
+            self._draw_centred(center_x + 125 * cos_a, center_y + 125 * sin_a - 5, ZODIAC_SYMBOLS.get(sign, '★'))
         
         # Big Three text below symbols
-        c.setFillColor(NAVY)
-        c.setFont(FONT_BODY_BOLD, 9)
-        c.drawCentredString(center_x, center_y - 22, f"{self.sun_sign[:3]} / {self.moon_sign[:3]} / {self.rising_sign[:3]}")
+        self._set_fill(NAVY)
+        self._set_font(FONT_BODY_BOLD, 9)
+        self._draw_centred(center_x, center_y - 22, f"{self.sun_sign[:3]} / {self.moon_sign[:3]} / {self.rising_sign[:3]}")
         
         # Planet positions table
         y_table = 2.8*inch
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
-        c.drawCentredString(self.width/2, y_table + 0.4*inch, "Your Planetary Positions")
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 14)
+        self._draw_centred(self.width/2, y_table + 0.4*inch, "Your Planetary Positions")
         
         # Draw table background - same as page cream color
         table_width = 5*inch
         table_x = (self.width - table_width) / 2
-        c.setFillColor(CREAM)
+        self._set_fill(CREAM)
         c.roundRect(table_x, y_table - 1.6*inch, table_width, 1.8*inch, 5, fill=1, stroke=0)
         
         planets = [
@@ -1218,7 +2225,7 @@ class OrastriaVisualBook:
         ]
         
         # Two columns
-        c.setFont(FONT_BODY, 10)
+        self._set_font(FONT_BODY, 10)
         y = y_table
         col1_x = table_x + 20
         col2_x = table_x + table_width/2 + 20
@@ -1227,15 +2234,15 @@ class OrastriaVisualBook:
             x = col1_x if i < 5 else col2_x
             row_y = y - (i % 5) * 0.3*inch
             
-            c.setFillColor(GOLD)
-            c.setFont(FONT_SYMBOL, 12)
+            self._set_fill(GOLD)
+            self._set_font(FONT_SYMBOL, 12)
             c.drawString(x, row_y, symbol)
             
-            c.setFillColor(NAVY)
-            c.setFont(FONT_BODY, 10)
+            self._set_fill(NAVY)
+            self._set_font(FONT_BODY, 10)
             c.drawString(x + 25, row_y, name)
             
-            c.setFillColor(HexColor('#444444'))
+            self._set_fill(DARK_GRAY)
             c.drawString(x + 90, row_y, sign)
         
         c.showPage()
@@ -1250,31 +2257,30 @@ class OrastriaVisualBook:
         
         # Quote box background
         box_height = 80
-        c.setFillColor(HexColor('#f8f5f0'))
-        c.roundRect(self.margin + 20, y - box_height + 20, self.width - 2*self.margin - 40, box_height, 8, fill=1, stroke=0)
+        self._set_fill(CREAM)
+        c.roundRect(self.margin + 20, y - box_height + 20, self.text_width - 40, box_height, 8, fill=1, stroke=0)
         
         # Left accent bar
-        c.setFillColor(GOLD)
+        self._set_fill(GOLD)
         c.rect(self.margin + 20, y - box_height + 20, 4, box_height, fill=1, stroke=0)
         
         # Quote mark
-        c.setFont(FONT_HEADING_BOLD, 36)
-        c.setFillColor(HexColor('#d4b87a'))
+        self._set_font(FONT_HEADING_BOLD, 36)
+        self._set_fill(SOFT_GOLD)
         c.drawString(self.margin + 35, y - 5, '"')
         
         # Quote text
-        c.setFillColor(NAVY)
-        c.setFont(FONT_BODY_ITALIC, 11)
-        wrapper = textwrap.TextWrapper(width=70)
-        lines = wrapper.wrap(quote)
+        self._set_fill(NAVY)
+        self._set_font(FONT_BODY_ITALIC, 11)
+        lines = wrap_to_width(quote, FONT_BODY_ITALIC, 11, self.text_width - 80)
         quote_y = y - 25
         for line in lines[:3]:
             c.drawString(self.margin + 50, quote_y, line)
             quote_y -= 16
         
         if attribution:
-            c.setFont(FONT_BODY, 9)
-            c.setFillColor(HexColor('#888888'))
+            self._set_font(FONT_BODY, 9)
+            self._set_fill(SOFT_GRAY)
             c.drawString(self.margin + 50, quote_y - 5, f"— {attribution}")
         
         return y - box_height - 20
@@ -1290,17 +2296,17 @@ class OrastriaVisualBook:
         box_height = 30 + len(points) * 22
         
         # Box background
-        c.setFillColor(HexColor('#1a1f3c'))
-        c.roundRect(self.margin, y - box_height + 10, self.width - 2*self.margin, box_height, 8, fill=1, stroke=0)
+        self._set_fill(NAVY)
+        c.roundRect(self.margin, y - box_height + 10, self.text_width, box_height, 8, fill=1, stroke=0)
         
         # Title
-        c.setFillColor(GOLD)
-        c.setFont(FONT_HEADING_BOLD, 12)
+        self._set_fill(GOLD)
+        self._set_font(FONT_HEADING_BOLD, 12)
         c.drawString(self.margin + 15, y - 5, f"✧ {title}")
         
         # Points
-        c.setFillColor(white)
-        c.setFont(FONT_BODY, 10)
+        self._set_fill(white)
+        self._set_font(FONT_BODY, 10)
         point_y = y - 28
         for point in points:
             c.drawString(self.margin + 25, point_y, f"• {point[:80]}")
@@ -1329,13 +2335,13 @@ class OrastriaVisualBook:
             ("Element", "Fire, Earth, Air, or Water - the fundamental energy of each sign."),
         ]
         
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 16)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 16)
         c.drawString(self.margin, y, "Understanding Your Chart")
         y -= 30
         
-        c.setFont(FONT_BODY, 10)
-        c.setFillColor(HexColor('#666666'))
+        self._set_font(FONT_BODY, 10)
+        self._set_fill(MID_GRAY)
         c.drawString(self.margin, y, "Reference these terms as you read through your personalized analysis.")
         y -= 30
         
@@ -1344,16 +2350,15 @@ class OrastriaVisualBook:
                 c.showPage()
                 y = self.new_page()
             
-            c.setFillColor(NAVY)
-            c.setFont(FONT_BODY_BOLD, 11)
+            self._set_fill(NAVY)
+            self._set_font(FONT_BODY_BOLD, 11)
             c.drawString(self.margin, y, term)
             
-            c.setFillColor(HexColor('#444444'))
-            c.setFont(FONT_BODY, 10)
+            self._set_fill(DARK_GRAY)
+            self._set_font(FONT_BODY, 10)
             
             # Wrap definition
-            wrapper = textwrap.TextWrapper(width=85)
-            lines = wrapper.wrap(definition)
+            lines = wrap_to_width(definition, FONT_BODY, 10, self.text_width - 10)
             def_y = y - 16
             for line in lines:
                 c.drawString(self.margin + 10, def_y, line)
@@ -1370,15 +2375,15 @@ class OrastriaVisualBook:
         c = self.c
         
         # Big Three summary box
-        c.setFillColor(HexColor('#1a1f3c'))
-        c.roundRect(self.margin, y - 100, self.width - 2*self.margin, 110, 10, fill=1, stroke=0)
+        self._set_fill(NAVY)
+        c.roundRect(self.margin, y - 100, self.text_width, 110, 10, fill=1, stroke=0)
         
-        c.setFillColor(GOLD)
-        c.setFont(FONT_HEADING_BOLD, 16)
-        c.drawCentredString(self.width/2, y - 15, "Your Big Three")
+        self._set_fill(GOLD)
+        self._set_font(FONT_HEADING_BOLD, 16)
+        self._draw_centred(self.width/2, y - 15, "Your Big Three")
         
         # Three columns
-        col_width = (self.width - 2*self.margin) / 3
+        col_width = (self.text_width) / 3
         placements = [
             ("☉", "SUN", self.sun_sign),
             ("☽", "MOON", self.moon_sign),
@@ -1388,26 +2393,26 @@ class OrastriaVisualBook:
         for i, (symbol, label, sign) in enumerate(placements):
             col_x = self.margin + col_width/2 + i * col_width
             
-            c.setFont(FONT_SYMBOL_BOLD, 28)
-            c.setFillColor(GOLD)
-            c.drawCentredString(col_x, y - 45, symbol)
+            self._set_font(FONT_SYMBOL_BOLD, 28)
+            self._set_fill(GOLD)
+            self._draw_centred(col_x, y - 45, symbol)
             
-            c.setFont(FONT_BODY, 9)
-            c.setFillColor(HexColor('#888888'))
-            c.drawCentredString(col_x, y - 65, label)
+            self._set_font(FONT_BODY, 9)
+            self._set_fill(SOFT_GRAY)
+            self._draw_centred(col_x, y - 65, label)
             
-            c.setFont(FONT_BODY_BOLD, 12)
-            c.setFillColor(white)
-            c.drawCentredString(col_x, y - 82, sign)
+            self._set_font(FONT_BODY_BOLD, 12)
+            self._set_fill(white)
+            self._draw_centred(col_x, y - 82, sign)
         
         y -= 130
         
         # Top compatible signs
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL, 14)
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL, 14)
         c.drawString(self.margin, y, "✧")
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 14)
         c.drawString(self.margin + 18, y, "Your Top Compatible Signs")
         y -= 25
         
@@ -1421,47 +2426,47 @@ class OrastriaVisualBook:
         )[:3]
         
         for sign, pct in sorted_compat:
-            c.setFillColor(GOLD)
-            c.setFont(FONT_SYMBOL, 14)
+            self._set_fill(GOLD)
+            self._set_font(FONT_SYMBOL, 14)
             c.drawString(self.margin + 10, y, ZODIAC_SYMBOLS.get(sign, '★'))
             
-            c.setFillColor(NAVY)
-            c.setFont(FONT_BODY_BOLD, 11)
+            self._set_fill(NAVY)
+            self._set_font(FONT_BODY_BOLD, 11)
             c.drawString(self.margin + 35, y, sign)
             
-            c.setFillColor(HexColor('#666666'))
-            c.setFont(FONT_BODY, 11)
+            self._set_fill(MID_GRAY)
+            self._set_font(FONT_BODY, 11)
             c.drawString(self.margin + 130, y, f"{pct}%")
             y -= 22
         
         y -= 20
         
         # Key numbers
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
-        c.setFont(FONT_SYMBOL, 14)
-        c.setFillColor(GOLD)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 14)
+        self._set_font(FONT_SYMBOL, 14)
+        self._set_fill(GOLD)
         c.drawString(self.margin, y, "✧")
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 14)
         c.drawString(self.margin + 18, y, "Your Numbers")
         y -= 25
         
         life_path = calculate_life_path(self.user.get('birth_date', '2000-01-01'))
         expression = calculate_expression_number(self.name)
         
-        c.setFont(FONT_BODY, 11)
-        c.setFillColor(HexColor('#444444'))
+        self._set_font(FONT_BODY, 11)
+        self._set_fill(DARK_GRAY)
         c.drawString(self.margin + 10, y, f"Life Path: {life_path}")
         c.drawString(self.margin + 150, y, f"Expression: {expression}")
         y -= 35
         
         # Key dates preview
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL, 14)
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL, 14)
         c.drawString(self.margin, y, "✧")
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 14)
         c.drawString(self.margin + 18, y, "2026 Highlights")
         y -= 25
         
@@ -1471,22 +2476,22 @@ class OrastriaVisualBook:
             "Personal transformation period approaching",
         ]
         
-        c.setFont(FONT_BODY, 10)
-        c.setFillColor(HexColor('#444444'))
+        self._set_font(FONT_BODY, 10)
+        self._set_fill(DARK_GRAY)
         for highlight in highlights:
             # Use bullet point instead of arrow
-            c.setFillColor(GOLD)
-            c.setFont(FONT_SYMBOL, 10)
+            self._set_fill(GOLD)
+            self._set_font(FONT_SYMBOL, 10)
             c.drawString(self.margin + 10, y, "•")
-            c.setFillColor(HexColor('#444444'))
-            c.setFont(FONT_BODY, 10)
+            self._set_fill(DARK_GRAY)
+            self._set_font(FONT_BODY, 10)
             c.drawString(self.margin + 25, y, highlight)
             y -= 18
         
         y -= 25
         
         # Lucky elements - 4 CARD DESIGN
-        element = ZODIAC_DATA.get(self.sun_sign, {}).get('element', 'Fire')
+        element = self.sun_data.get('element', 'Fire')
         lucky_colors = {
             'Fire': 'Red, Orange, Gold',
             'Earth': 'Green, Brown, Tan',
@@ -1501,53 +2506,53 @@ class OrastriaVisualBook:
         }
         
         # Section title
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL, 14)
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL, 14)
         c.drawString(self.margin, y, "✧")
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 14)
         c.drawString(self.margin + 18, y, "Your Lucky Elements")
         y -= 25
         
         # 4 cards in a row - wider cards
-        card_width = (self.width - 2*self.margin - 24) / 4
+        card_width = (self.text_width - 24) / 4
         card_height = 75
         card_y = y - card_height
         
         # Use only DejaVuSans-supported icons
         cards = [
-            ("Element", element, ZODIAC_SYMBOLS.get(self.sun_sign, '★')),
+            ("Element", element, self.sun_symbol),
             ("Lucky Colors", lucky_colors.get(element, 'Gold'), "◆"),
             ("Lucky Days", lucky_days.get(element, 'Sunday'), "☆"),
-            ("Power Crystal", ZODIAC_DATA.get(self.sun_sign, {}).get('crystal', 'Quartz'), "◇"),
+            ("Power Crystal", self.sun_data.get('crystal', 'Quartz'), "◇"),
         ]
         
         for i, (label, value, icon) in enumerate(cards):
             card_x = self.margin + i * (card_width + 8)
             
             # Card background
-            c.setFillColor(HexColor('#f5f3ef'))
+            self._set_fill(CARD_FILL)
             c.roundRect(card_x, card_y, card_width, card_height, 8, fill=1, stroke=0)
             
             # Card border
-            c.setStrokeColor(HexColor('#e0dcd5'))
+            c.setStrokeColor(CARD_BORDER)
             c.setLineWidth(1)
             c.roundRect(card_x, card_y, card_width, card_height, 8, fill=0, stroke=1)
             
             # Icon at top
-            c.setFillColor(GOLD)
-            c.setFont(FONT_SYMBOL, 18)
-            c.drawCentredString(card_x + card_width/2, card_y + card_height - 20, icon)
+            self._set_fill(GOLD)
+            self._set_font(FONT_SYMBOL, 18)
+            self._draw_centred(card_x + card_width/2, card_y + card_height - 20, icon)
             
             # Label
-            c.setFillColor(HexColor('#888888'))
-            c.setFont(FONT_BODY, 8)
-            c.drawCentredString(card_x + card_width/2, card_y + card_height - 38, label)
+            self._set_fill(SOFT_GRAY)
+            self._set_font(FONT_BODY, 8)
+            self._draw_centred(card_x + card_width/2, card_y + card_height - 38, label)
             
             # Value - smaller font to fit
-            c.setFillColor(NAVY)
-            c.setFont(FONT_BODY_BOLD, 8)
-            c.drawCentredString(card_x + card_width/2, card_y + 12, value)
+            self._set_fill(NAVY)
+            self._set_font(FONT_BODY_BOLD, 8)
+            self._draw_centred(card_x + card_width/2, card_y + 12, value)
         
         c.showPage()
     
@@ -1556,62 +2561,53 @@ class OrastriaVisualBook:
         c = self.c
         self.page_num += 1
         
-        # Colors for this page
-        DEEP_NAVY = HexColor('#0f1628')
-        MID_NAVY = HexColor('#252b4a')
-        PURPLE_ICON = HexColor('#6b4c9a')
-        LIGHT_PURPLE = HexColor('#9b7bc7')
-        TEAL = HexColor('#2d7a6d')
-        LIGHT_TEAL = HexColor('#3a9a8a')
-        SOFT_GOLD = HexColor('#d4b87a')
-        
         # Background gradient effect
         steps = 60
         step_height = self.height / steps
         color1 = DEEP_NAVY
-        color2 = HexColor('#1a2040')
+        color2 = GRADIENT_NAVY
         for i in range(steps):
             ratio = i / steps
             r = color1.red + (color2.red - color1.red) * ratio
             g = color1.green + (color2.green - color1.green) * ratio
             b = color1.blue + (color2.blue - color1.blue) * ratio
-            c.setFillColor(Color(r, g, b))
+            self._set_fill(Color(r, g, b))
             c.rect(0, self.height - (i + 1) * step_height, self.width, step_height + 1, fill=1, stroke=0)
         
         # Top decorative arc
-        c.setFillColor(MID_NAVY)
+        self._set_fill(MID_NAVY)
         c.ellipse(-2*inch, self.height - 2*inch, self.width + 2*inch, self.height + 2.5*inch, fill=1, stroke=0)
         
         # Gold accent line at top
-        c.setFillColor(GOLD)
+        self._set_fill(GOLD)
         c.rect(0, self.height - 6, self.width, 6, fill=1, stroke=0)
         
         # Corner stars
-        c.setFillColor(SOFT_GOLD)
-        c.setFont(FONT_SYMBOL, 10)
-        c.drawCentredString(35, self.height - 35, '✦')
-        c.drawCentredString(self.width - 35, self.height - 35, '✦')
+        self._set_fill(SOFT_GOLD)
+        self._set_font(FONT_SYMBOL, 10)
+        self._draw_centred(35, self.height - 35, '✦')
+        self._draw_centred(self.width - 35, self.height - 35, '✦')
         
         # ---- HEADER ----
         
         # "EXCLUSIVE GIFT" badge
         badge_y = self.height - 70
-        c.setFillColor(GOLD)
+        self._set_fill(GOLD)
         c.roundRect(self.width/2 - 85, badge_y - 9, 170, 24, 12, fill=1, stroke=0)
-        c.setFillColor(DEEP_NAVY)
-        c.setFont(FONT_BODY_BOLD, 9)
-        c.drawCentredString(self.width/2, badge_y - 1, "YOUR EXCLUSIVE GIFT")
+        self._set_fill(DEEP_NAVY)
+        self._set_font(FONT_BODY_BOLD, 9)
+        self._draw_centred(self.width/2, badge_y - 1, "YOUR EXCLUSIVE GIFT")
         
         # Main headline
-        c.setFillColor(white)
-        c.setFont(FONT_HEADING_BOLD, 34)
-        c.drawCentredString(self.width/2, self.height - 115, "Continue Your")
-        c.drawCentredString(self.width/2, self.height - 152, "Cosmic Journey")
+        self._set_fill(white)
+        self._set_font(FONT_HEADING_BOLD, 34)
+        self._draw_centred(self.width/2, self.height - 115, "Continue Your")
+        self._draw_centred(self.width/2, self.height - 152, "Cosmic Journey")
         
         # Subheadline
-        c.setFillColor(SOFT_GOLD)
-        c.setFont(FONT_BODY_ITALIC, 13)
-        c.drawCentredString(self.width/2, self.height - 180, "Your personalized book is just the beginning")
+        self._set_fill(SOFT_GOLD)
+        self._set_font(FONT_BODY_ITALIC, 13)
+        self._draw_centred(self.width/2, self.height - 180, "Your personalized book is just the beginning")
         
         # ---- IMAGE (no holder, direct display) ----
         
@@ -1620,54 +2616,41 @@ class OrastriaVisualBook:
         img_height = 2.5 * inch
         img_x = (self.width - img_width) / 2
         
-        # Try to load and draw the promo image
-        promo_image_url = "https://f005.backblazeb2.com/file/publicorastria/book-last-page-image.png"
-        try:
-            import tempfile
-            import urllib.request
-            
-            # Download image to temp file
-            temp_img = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-            urllib.request.urlretrieve(promo_image_url, temp_img.name)
-            
-            # Draw image directly without holder
-            c.drawImage(temp_img.name, img_x, img_y, width=img_width, height=img_height, 
+        # Draw the promo image directly, without a holder
+        image = promo_image(img_width, img_height)
+        if image:
+            c.drawImage(image, img_x, img_y, width=img_width, height=img_height,
                        preserveAspectRatio=True, mask='auto')
-            
-            # Clean up
-            import os
-            os.unlink(temp_img.name)
-        except Exception as e:
-            print(f"⚠️ Could not load promo image: {e}")
+        else:
             # Fallback: simple text
-            c.setFillColor(SOFT_GOLD)
-            c.setFont(FONT_BODY, 11)
-            c.drawCentredString(self.width/2, img_y + img_height/2, "Visit orastria.com")
+            self._set_fill(SOFT_GOLD)
+            self._set_font(FONT_BODY, 11)
+            self._draw_centred(self.width/2, img_y + img_height/2, "Visit orastria.com")
         
         # ---- FREE TRIAL BANNER ----
         
         trial_y = img_y - 50
         
-        c.setFillColor(TEAL)
+        self._set_fill(TEAL)
         c.roundRect(self.width/2 - 135, trial_y - 10, 270, 34, 17, fill=1, stroke=0)
         
-        c.setFillColor(LIGHT_TEAL)
+        self._set_fill(LIGHT_TEAL)
         c.roundRect(self.width/2 - 132, trial_y - 7, 264, 28, 14, fill=1, stroke=0)
         
-        c.setFillColor(white)
-        c.setFont(FONT_BODY_BOLD, 13)
-        c.drawCentredString(self.width/2, trial_y + 1, "FREE 1-MONTH TRIAL INCLUDED")
+        self._set_fill(white)
+        self._set_font(FONT_BODY_BOLD, 13)
+        self._draw_centred(self.width/2, trial_y + 1, "FREE 1-MONTH TRIAL INCLUDED")
         
         # ---- FEATURES ----
         
         features_header_y = trial_y - 45
         
-        c.setFillColor(GOLD)
-        c.setFont(FONT_HEADING_BOLD, 18)
-        c.drawCentredString(self.width/2, features_header_y, "Unlock Your Full Cosmic Toolkit")
+        self._set_fill(GOLD)
+        self._set_font(FONT_HEADING_BOLD, 18)
+        self._draw_centred(self.width/2, features_header_y, "Unlock Your Full Cosmic Toolkit")
         
         # Divider line
-        c.setStrokeColor(HexColor('#3a4060'))
+        c.setStrokeColor(BORDER_NAVY)
         c.setLineWidth(1)
         c.line(self.margin + 80, features_header_y - 12, self.width - self.margin - 80, features_header_y - 12)
         
@@ -1698,25 +2681,25 @@ class OrastriaVisualBook:
             y = start_y - row * row_height
             
             # Icon circle
-            c.setFillColor(PURPLE_ICON)
+            self._set_fill(PURPLE_ICON)
             c.circle(x + 16, y + 6, 18, fill=1, stroke=0)
             
-            c.setFillColor(LIGHT_PURPLE)
+            self._set_fill(LIGHT_PURPLE)
             c.circle(x + 16, y + 7, 15, fill=1, stroke=0)
             
             # Icon
-            c.setFillColor(white)
-            c.setFont(FONT_SYMBOL_BOLD, 14)
-            c.drawCentredString(x + 16, y + 2, icon)
+            self._set_fill(white)
+            self._set_font(FONT_SYMBOL_BOLD, 14)
+            self._draw_centred(x + 16, y + 2, icon)
             
             # Title
-            c.setFillColor(white)
-            c.setFont(FONT_BODY_BOLD, 10)
+            self._set_fill(white)
+            self._set_font(FONT_BODY_BOLD, 10)
             c.drawString(x + 40, y + 10, title)
             
             # Description
-            c.setFillColor(HexColor('#9999aa'))
-            c.setFont(FONT_BODY, 8)
+            self._set_fill(MUTED_LAVENDER)
+            self._set_font(FONT_BODY, 8)
             c.drawString(x + 40, y - 4, desc)
         
         # ---- CTA ----
@@ -1724,51 +2707,51 @@ class OrastriaVisualBook:
         cta_y = 75
         
         # Separator
-        c.setStrokeColor(HexColor('#3a4060'))
+        c.setStrokeColor(BORDER_NAVY)
         c.setLineWidth(0.5)
         c.line(self.margin + 100, cta_y + 50, self.width - self.margin - 100, cta_y + 50)
         
         # Button shadow
-        c.setFillColor(HexColor('#a07d1f'))
+        self._set_fill(BUTTON_SHADOW)
         c.roundRect(self.width/2 - 112, cta_y - 2, 224, 42, 21, fill=1, stroke=0)
         
         # Button
-        c.setFillColor(GOLD)
+        self._set_fill(GOLD)
         c.roundRect(self.width/2 - 110, cta_y, 220, 40, 20, fill=1, stroke=0)
         
-        c.setFillColor(DEEP_NAVY)
-        c.setFont(FONT_BODY_BOLD, 14)
-        c.drawCentredString(self.width/2, cta_y + 13, "Start Your Free Trial")
+        self._set_fill(DEEP_NAVY)
+        self._set_font(FONT_BODY_BOLD, 14)
+        self._draw_centred(self.width/2, cta_y + 13, "Start Your Free Trial")
         
         # Add clickable hyperlink over the button area
         c.linkURL("https://orastria.com/?from=book", (self.width/2 - 112, cta_y - 2, self.width/2 + 112, cta_y + 42), relative=0)
         
         # URL text (also clickable)
-        c.setFillColor(SOFT_GOLD)
-        c.setFont(FONT_BODY, 10)
-        c.drawCentredString(self.width/2, cta_y - 18, "orastria.com")
+        self._set_fill(SOFT_GOLD)
+        self._set_font(FONT_BODY, 10)
+        self._draw_centred(self.width/2, cta_y - 18, "orastria.com")
         
         # Add clickable link to URL text too
         c.linkURL("https://orastria.com/?from=book", (self.width/2 - 50, cta_y - 28, self.width/2 + 50, cta_y - 8), relative=0)
         
         # ---- FOOTER ----
         
-        c.setFillColor(SOFT_GOLD)
-        c.setFont(FONT_SYMBOL, 10)
-        c.drawCentredString(35, 35, '✦')
-        c.drawCentredString(self.width - 35, 35, '✦')
+        self._set_fill(SOFT_GOLD)
+        self._set_font(FONT_SYMBOL, 10)
+        self._draw_centred(35, 35, '✦')
+        self._draw_centred(self.width - 35, 35, '✦')
         
-        c.setFillColor(HexColor('#555566'))
-        c.setFont(FONT_BODY, 8)
-        c.drawCentredString(self.width/2, 22, "— Your journey continues —")
+        self._set_fill(FOOTER_GRAY)
+        self._set_font(FONT_BODY, 8)
+        self._draw_centred(self.width/2, 22, "— Your journey continues —")
         
         c.showPage()
     
     def draw_section_title(self, text, y):
         """Draw section title with underline"""
         c = self.c
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 18)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 18)
         c.drawString(self.margin, y, text)
         
         c.setStrokeColor(GOLD)
@@ -1783,13 +2766,13 @@ class OrastriaVisualBook:
             return y
         
         c = self.c
-        c.setFillColor(NAVY)
-        c.setFont(FONT_BODY, 11)
+        self._set_fill(NAVY)
+        self._set_font(FONT_BODY, 11)
         
         if width is None:
-            width = self.width - 2 * self.margin
+            width = self.text_width
+        bottom = self.margin + 50
         
-        wrapper = textwrap.TextWrapper(width=int(width / 5.5))
         paragraphs = text.split('\n\n') if '\n\n' in text else text.split('\n')
         
         for para in paragraphs:
@@ -1797,16 +2780,23 @@ class OrastriaVisualBook:
             if not para:
                 continue
             
-            lines = wrapper.wrap(para)
-            for line in lines:
-                if y < self.margin + 50:
+            # Draw the paragraph a page-sized run of lines at a time
+            lines = wrap_to_width(para, FONT_BODY, 11, width)
+            while lines:
+                if y < bottom:
                     c.showPage()
                     y = self.new_page()
-                    c.setFillColor(NAVY)
-                    c.setFont(FONT_BODY, 11)
+                    self._set_fill(NAVY)
+                    self._set_font(FONT_BODY, 11)
                 
-                c.drawString(self.margin, y, line)
-                y -= 16
+                # One text object per run: a single BT/ET block with T* line breaks
+                fit = int((y - bottom) // 16) + 1
+                run, lines = lines[:fit], lines[fit:]
+                text_obj = c.beginText(self.margin, y)
+                text_obj.setLeading(16)
+                text_obj.textLines(run)
+                c.drawText(text_obj)
+                y -= 16 * len(run)
             
             y -= 8
         
@@ -1825,16 +2815,15 @@ class OrastriaVisualBook:
             percentage = data.get('percentage', 70)
         else:
             text = data
-            import re
-            match = re.search(r'(\d+)%', text)
+            match = PERCENT_RE.search(text)
             percentage = int(match.group(1)) if match else 70
         
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL_BOLD, 18)
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL_BOLD, 18)
         c.drawString(self.margin, y, ZODIAC_SYMBOLS.get(sign, '★'))
         
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 14)
         c.drawString(self.margin + 30, y, sign)
         
         bar_width = 120
@@ -1842,48 +2831,87 @@ class OrastriaVisualBook:
         bar_x = self.width - self.margin - bar_width - 50
         bar_y = y - 2
         
-        c.setFillColor(LIGHT_GRAY)
+        self._set_fill(LIGHT_GRAY)
         c.rect(bar_x, bar_y, bar_width, bar_height, fill=1, stroke=0)
         
         fill_width = bar_width * (percentage / 100)
-        c.setFillColor(self.get_compat_color(percentage))
+        self._set_fill(self.get_compat_color(percentage))
         c.rect(bar_x, bar_y, fill_width, bar_height, fill=1, stroke=0)
         
-        c.setFillColor(NAVY)
-        c.setFont(FONT_BODY_BOLD, 11)
+        self._set_fill(NAVY)
+        self._set_font(FONT_BODY_BOLD, 11)
         c.drawString(bar_x + bar_width + 10, y - 2, f"{percentage}%")
         
         y -= 25
         
         if text:
-            sentences = text.split('.')[:3]
-            short_text = '.'.join(sentences) + '.' if sentences else text[:200]
+            # First three sentences - scan for the third '.' rather than splitting it all
+            end = -1
+            for _ in range(3):
+                end = text.find('.', end + 1)
+                if end == -1:
+                    break
+            short_text = text[:end + 1] if end != -1 else text + '.'
             y = self.draw_text(short_text, y, width=self.width - 2.5*self.margin)
         
         return y - 15
     
-    def draw_monthly_entry(self, month, text, y):
-        """Draw monthly forecast entry"""
+    def draw_monthly_section(self, monthly):
+        """Draw all monthly forecasts, batching each page's text into one text object"""
         c = self.c
+        text_width = self.text_width
         
-        if y < self.margin + 100:
+        def next_page(text_obj):
+            c.drawText(text_obj)
             c.showPage()
-            y = self.new_page()
-        
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL, 12)
-        c.drawString(self.margin, y, "✧")
+            return self.new_page(), c.beginText()
         
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 14)
-        c.drawString(self.margin + 20, y, f"{month} 2026")
+        # Wrap every month up front (one list of lines per paragraph) so the
+        # page loop below only places lines
+        wrapped = {}
+        for month in MONTHS:
+            text = monthly.get(month, '')
+            paragraphs = text.split('\n\n') if '\n\n' in text else text.split('\n')
+            wrapped[month] = [wrap_to_width(para, FONT_BODY, 11, text_width)
+                              for para in paragraphs if para.strip()]
         
-        y -= 20
+        y = self.new_page()
+        to = c.beginText()
         
-        if text:
-            y = self.draw_text(text, y)
+        for month in MONTHS:
+            if y < self.margin + 100:
+                y, to = next_page(to)
+            
+            to.setTextOrigin(self.margin, y)
+            to.setFillColor(GOLD)
+            to.setFont(FONT_SYMBOL, 12)
+            to.textOut("✧")
+            
+            to.setTextOrigin(self.margin + 20, y)
+            to.setFillColor(NAVY)
+            to.setFont(FONT_HEADING_BOLD, 14)
+            to.textOut(f"{month} 2026")
+            
+            y -= 20
+            
+            if monthly.get(month):
+                to.setFont(FONT_BODY, 11)
+                for lines in wrapped[month]:
+                    for line in lines:
+                        if y < self.margin + 50:
+                            y, to = next_page(to)
+                            to.setFillColor(NAVY)
+                            to.setFont(FONT_BODY, 11)
+                        
+                        to.setTextOrigin(self.margin, y)
+                        to.textOut(line)
+                        y -= 16
+                    
+                    y -= 8
+            
+            y -= 10
         
-        return y - 10
+        c.drawText(to)
     
     def draw_table_of_contents(self):
         """Draw table of contents page"""
@@ -1891,13 +2919,13 @@ class OrastriaVisualBook:
         c = self.c
         
         # Title
-        c.setFillColor(GOLD)
-        c.setFont(FONT_SYMBOL, 24)
-        c.drawCentredString(self.width/2, self.height - 80, "✧")
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL, 24)
+        self._draw_centred(self.width/2, self.height - 80, "✧")
         
-        c.setFillColor(NAVY)
-        c.setFont(FONT_HEADING_BOLD, 28)
-        c.drawCentredString(self.width/2, self.height - 120, "Table of Contents")
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 28)
+        self._draw_centred(self.width/2, self.height - 120, "Table of Contents")
         
         # Decorative line
         c.setStrokeColor(GOLD)
@@ -1927,17 +2955,17 @@ class OrastriaVisualBook:
         
         for title, icon in toc_entries:
             # Icon
-            c.setFillColor(GOLD)
-            c.setFont(FONT_SYMBOL, 12)
+            self._set_fill(GOLD)
+            self._set_font(FONT_SYMBOL, 12)
             c.drawString(self.margin + 10, y, icon)
             
             # Title
-            c.setFillColor(NAVY)
-            c.setFont(FONT_BODY, 12)
+            self._set_fill(NAVY)
+            self._set_font(FONT_BODY, 12)
             c.drawString(self.margin + 35, y, title)
             
             # Dots leading line
-            c.setFillColor(HexColor('#cccccc'))
+            self._set_fill(RULE_GRAY)
             dots_start = self.margin + 40 + c.stringWidth(title, FONT_BODY, 12)
             dots_end = self.width - self.margin
             dot_x = dots_start + 10
@@ -1949,8 +2977,36 @@ class OrastriaVisualBook:
         
         c.showPage()
     
-    def build(self):
-        """Build the complete book"""
+    def draw_text_chapter(self, key, title, subtitle, heading):
+        """Chapter page plus body for one AI section - nothing at all if the section is empty"""
+        text = self.content.get(key)
+        if not text:
+            return
+        
+        self.draw_chapter(title, subtitle)
+        y = self.new_page()
+        y = self.draw_section_title(heading, y)
+        self.draw_text(text, y)
+        self.c.showPage()
+    
+    def draw_placement_page(self, key, symbol, heading):
+        """One Big Three page: large glyph, heading and the section text (skipped if empty)"""
+        text = self.content.get(key)
+        if not text:
+            return
+        
+        self.new_page()
+        self._set_fill(GOLD)
+        self._set_font(FONT_SYMBOL_BOLD, 48)
+        self._draw_centred(self.width/2, self.height - 120, symbol)
+        self._set_fill(NAVY)
+        self._set_font(FONT_HEADING_BOLD, 20)
+        self._draw_centred(self.width/2, self.height - 160, heading)
+        self.draw_text(text, self.height - 200)
+        self.c.showPage()
+    
+    def build(self, pending=None):
+        """Build the complete book - `pending` is a Future to wait on once the front matter is drawn"""
         print(f"\n📖 Building PDF for {self.name}...")
         
         self.draw_cover()
@@ -1966,124 +3022,61 @@ class OrastriaVisualBook:
         if familiarity.lower() in ['beginner', 'new', 'none', 'just starting']:
             self.draw_glossary_page()
         
+        # Everything from here on reads the AI content
+        if pending is not None:
+            pending.result()
+        
         # Introduction
-        self.draw_chapter("Introduction", "Your Cosmic Journey Begins")
-        y = self.new_page()
-        y = self.draw_section_title(f"Welcome, {self.first_name}", y)
-        y = self.draw_text(self.content.get('introduction', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('introduction', "Introduction", "Your Cosmic Journey Begins", f"Welcome, {self.first_name}")
         
         # The Big Three
-        self.draw_chapter("The Big Three", "Sun, Moon & Rising")
-        
-        y = self.new_page()
-        self.c.setFillColor(GOLD)
-        self.c.setFont(FONT_SYMBOL_BOLD, 48)
-        self.c.drawCentredString(self.width/2, self.height - 120, ZODIAC_SYMBOLS.get(self.sun_sign, '★'))
-        self.c.setFillColor(NAVY)
-        self.c.setFont(FONT_HEADING_BOLD, 20)
-        self.c.drawCentredString(self.width/2, self.height - 160, f"Your Sun in {self.sun_sign}")
-        y = self.height - 200
-        y = self.draw_text(self.content.get('sun_sign', ''), y)
-        self.c.showPage()
-        
-        y = self.new_page()
-        self.c.setFillColor(GOLD)
-        self.c.setFont(FONT_SYMBOL_BOLD, 48)
-        self.c.drawCentredString(self.width/2, self.height - 120, '☽')
-        self.c.setFillColor(NAVY)
-        self.c.setFont(FONT_HEADING_BOLD, 20)
-        self.c.drawCentredString(self.width/2, self.height - 160, f"Your Moon in {self.moon_sign}")
-        y = self.height - 200
-        y = self.draw_text(self.content.get('moon_sign', ''), y)
-        self.c.showPage()
-        
-        y = self.new_page()
-        self.c.setFillColor(GOLD)
-        self.c.setFont(FONT_SYMBOL_BOLD, 48)
-        self.c.drawCentredString(self.width/2, self.height - 120, '↑')
-        self.c.setFillColor(NAVY)
-        self.c.setFont(FONT_HEADING_BOLD, 20)
-        self.c.drawCentredString(self.width/2, self.height - 160, f"Your {self.rising_sign} Rising")
-        y = self.height - 200
-        y = self.draw_text(self.content.get('rising_sign', ''), y)
-        self.c.showPage()
+        if any(self.content.get(key) for key in ('sun_sign', 'moon_sign', 'rising_sign')):
+            self.draw_chapter("The Big Three", "Sun, Moon & Rising")
+            self.draw_placement_page('sun_sign', self.sun_symbol, f"Your Sun in {self.sun_sign}")
+            self.draw_placement_page('moon_sign', '☽', f"Your Moon in {self.moon_sign}")
+            self.draw_placement_page('rising_sign', '↑', f"Your {self.rising_sign} Rising")
         
         # Personality
-        self.draw_chapter("Your Inner World", "Deep Personality Analysis")
-        y = self.new_page()
-        y = self.draw_section_title("Understanding Your Psychology", y)
-        y = self.draw_text(self.content.get('personality', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('personality', "Your Inner World", "Deep Personality Analysis", "Understanding Your Psychology")
         
         # Love
-        self.draw_chapter("Love & Relationships", "Your Heart's Blueprint")
-        y = self.new_page()
-        y = self.draw_section_title("Your Romantic Nature", y)
-        y = self.draw_text(self.content.get('love', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('love', "Love & Relationships", "Your Heart's Blueprint", "Your Romantic Nature")
         
         # Compatibility
-        self.draw_chapter("Compatibility Guide", "Your Match with All 12 Signs")
-        y = self.new_page()
-        for sign in ZODIAC_ORDER:
-            data = self.content.get('compatibility', {}).get(sign, {'text': '', 'percentage': 70})
-            y = self.draw_compat_entry(sign, data, y)
-        self.c.showPage()
+        compatibility = self.content.get('compatibility', {})
+        if compatibility:
+            self.draw_chapter("Compatibility Guide", "Your Match with All 12 Signs")
+            y = self.new_page()
+            for sign in ZODIAC_ORDER:
+                data = compatibility.get(sign, {'text': '', 'percentage': 70})
+                y = self.draw_compat_entry(sign, data, y)
+            self.c.showPage()
         
         # Career
-        self.draw_chapter("Career & Purpose", "Your Professional Destiny")
-        y = self.new_page()
-        y = self.draw_section_title("Your Career Blueprint", y)
-        y = self.draw_text(self.content.get('career', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('career', "Career & Purpose", "Your Professional Destiny", "Your Career Blueprint")
         
         # Important Dates (if generated)
-        if 'important_dates' in self.content and self.content['important_dates']:
-            self.draw_chapter("Important Dates", "Key Moments in Your Future")
-            y = self.new_page()
-            y = self.draw_section_title("Your Significant Dates", y)
-            y = self.draw_text(self.content.get('important_dates', ''), y)
-            self.c.showPage()
+        self.draw_text_chapter('important_dates', "Important Dates", "Key Moments in Your Future", "Your Significant Dates")
         
         # 2026 Forecast
-        self.draw_chapter("Your Year Ahead", "2026 Forecast")
-        y = self.new_page()
-        y = self.draw_section_title("2026 Overview", y)
-        y = self.draw_text(self.content.get('forecast', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('forecast', "Your Year Ahead", "2026 Forecast", "2026 Overview")
         
         # Monthly Forecasts
-        self.draw_chapter("Monthly Forecasts", "Your 2026 Month-by-Month Guide")
-        y = self.new_page()
-        all_months = ["January", "February", "March", "April", "May", "June",
-                      "July", "August", "September", "October", "November", "December"]
-        for month in all_months:
-            text = self.content.get('monthly', {}).get(month, '')
-            y = self.draw_monthly_entry(month, text, y)
-        self.c.showPage()
+        monthly = self.content.get('monthly', {})
+        if any(monthly.values()):
+            self.draw_chapter("Monthly Forecasts", "Your 2026 Month-by-Month Guide")
+            self.draw_monthly_section(monthly)
+            self.c.showPage()
         
         # Numerology
-        self.draw_chapter("Numerology", "The Numbers of Your Life")
-        y = self.new_page()
         life_path = calculate_life_path(self.user.get('birth_date', '2000-01-01'))
-        y = self.draw_section_title(f"Life Path {life_path}", y)
-        y = self.draw_text(self.content.get('numerology', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('numerology', "Numerology", "The Numbers of Your Life", f"Life Path {life_path}")
         
         # Tarot
-        self.draw_chapter("Tarot Guidance", "Cards for Your Journey")
-        y = self.new_page()
-        y = self.draw_section_title("Your Tarot Reading", y)
-        y = self.draw_text(self.content.get('tarot', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('tarot', "Tarot Guidance", "Cards for Your Journey", "Your Tarot Reading")
         
         # Crystals
-        self.draw_chapter("Crystals & Rituals", "Tools for Your Path")
-        y = self.new_page()
-        y = self.draw_section_title("Your Power Crystals", y)
-        y = self.draw_text(self.content.get('crystals', ''), y)
-        self.c.showPage()
+        self.draw_text_chapter('crystals', "Crystals & Rituals", "Tools for Your Path", "Your Power Crystals")
         
         # Summary page (NEW - before closing)
         self.draw_summary_page()
@@ -2095,18 +3088,30 @@ class OrastriaVisualBook:
         y = self.draw_text(self.content.get('closing', ''), y)
         
         y -= 40
-        self.c.setFillColor(NAVY)
-        self.c.setFont(FONT_BODY_ITALIC, 14)
+        self._set_fill(NAVY)
+        self._set_font(FONT_BODY_ITALIC, 14)
         self.c.drawString(self.margin, y, "With cosmic blessings,")
-        self.c.setFillColor(GOLD)
-        self.c.setFont(FONT_HEADING_BOLD, 26)
+        self._set_fill(GOLD)
+        self._set_font(FONT_HEADING_BOLD, 26)
         self.c.drawString(self.margin, y - 35, "ORASTRIA")
         self.c.showPage()
         
         # Upsell page (final page)
         self.draw_upsell_page()
         
-        self.c.save()
+        try:
+            self.c.save()
+            # Linearized ("fast web view") PDFs show page 1 before the download finishes
+            optimize_pdf(self.partial_path)
+            with open(self.partial_path, 'rb') as f:
+                os.fsync(f.fileno())
+            os.replace(self.partial_path, self.output_path)
+        except Exception:
+            try:
+                os.unlink(self.partial_path)
+            except OSError:
+                pass
+            raise
         print(f"✅ Book saved: {self.output_path}")
         print(f"📄 Total pages: {self.page_num}")
         return self.output_path
@@ -2116,46 +3121,106 @@ class OrastriaVisualBook:
 # MAIN FUNCTIONS
 # ============================================================
 
+@lru_cache(maxsize=1)
+def source_fingerprint():
+    """Hash of this module's source - part of the book cache key, so template changes invalidate it"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
 def generate_ai_book(user_data, chart_data, output_path):
     """
     Generate complete AI-powered astrology book.
     BACKWARD COMPATIBLE - uses provided chart_data.
     """
+    cached_path = None
+    if BOOK_CACHE_DIR:
+        key = cache_key(source_fingerprint(), json.dumps(user_data, sort_keys=True, default=str),
+                        json.dumps(chart_data, sort_keys=True, default=str))
+        cached_path = os.path.join(BOOK_CACHE_DIR, f"{key}.pdf")
+        try:
+            if time.time() - os.path.getmtime(cached_path) <= BOOK_CACHE_TTL:
+                shutil.copyfile(cached_path, f"{output_path}.partial")
+                os.replace(f"{output_path}.partial", output_path)
+                print(f"✅ Book served from cache: {output_path}")
+                return output_path
+        except OSError:
+            try:
+                os.unlink(f"{output_path}.partial")
+            except OSError:
+                pass
+    
     ai_gen = AIContentGenerator(user_data, chart_data)
-    content = ai_gen.generate_all()
-    book = OrastriaVisualBook(user_data, chart_data, content, output_path)
-    return book.build()
-
-
-def generate_book(user_data, output_path):
+    
+    # Start the AI calls first: font setup (in the book's __init__) and the front
+    # matter, which doesn't depend on the AI content, then run while they're in flight
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = executor.submit(ai_gen.generate_all)
+    try:
+        book = OrastriaVisualBook(user_data, chart_data, ai_gen.content, output_path)
+        result = book.build(pending=pending)
+    except BaseException:
+        # Report the failure now rather than after the in-flight AI calls finish
+        pending.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    # The book is on disk, so there is nothing left to resume
+    ai_gen.clear_progress()
+    
+    # Books with fallback text are not cached, so the next request retries the AI
+    if cached_path and not ai_gen.fallback_used:
+        tmp_name = None
+        try:
+            os.makedirs(BOOK_CACHE_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=BOOK_CACHE_DIR, suffix='.tmp', delete=False) as tmp:
+                tmp_name = tmp.name
+            shutil.copyfile(output_path, tmp_name)
+            os.replace(tmp_name, cached_path)
+        except OSError as e:
+            print(f"⚠️ Book cache write failed: {e}")
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+    return result
+
+
+# Every placement the book needs - if the request carries all of them, Prokerala is skipped
+CHART_KEYS = ('sun_sign', 'moon_sign', 'rising_sign', 'mercury', 'venus',
+              'mars', 'jupiter', 'saturn', 'midheaven', 'north_node')
+
+
+def generate_book(user_data, output_path, force_prokerala=False):
     """
     Generate complete AI-powered astrology book with Prokerala integration.
-    NEW FUNCTION - fetches chart from Prokerala API.
+    NEW FUNCTION - fetches chart from Prokerala API unless the request already
+    includes a complete chart (pass force_prokerala=True to fetch anyway).
     """
     chart_data = None
+    provided = {key: user_data.get(key) for key in CHART_KEYS}
+    
+    if all(provided.values()) and not force_prokerala:
+        print("✅ Using complete chart data from request, skipping Prokerala")
+        chart_data = provided
     
     # Try to get chart from Prokerala
-    if PROKERALA_CLIENT_ID and PROKERALA_CLIENT_SECRET:
+    elif PROKERALA_CLIENT_ID and PROKERALA_CLIENT_SECRET:
         print("🔮 Fetching chart from Prokerala...")
         birth_date = user_data.get('birth_date', '')
         birth_time = user_data.get('birth_time', '12:00')
         birth_place = user_data.get('birth_place', '')
         
         # Convert 12-hour to 24-hour if needed
-        time_period = user_data.get('birth_time_period', '').upper()
-        if time_period == 'PM' and ':' in birth_time:
-            parts = birth_time.split(':')
-            hour = int(parts[0])
-            if hour != 12:
-                hour += 12
-            birth_time = f"{hour:02d}:{parts[1]}"
-        elif time_period == 'AM' and ':' in birth_time:
-            parts = birth_time.split(':')
-            hour = int(parts[0])
-            if hour == 12:
-                hour = 0
-            birth_time = f"{hour:02d}:{parts[1]}"
+        time_period = user_data.get('birth_time_period', '')
+        try:
+            birth_time = datetime.strptime(f"{birth_time} {time_period}", "%I:%M %p").strftime("%H:%M")
+        except ValueError:
+            pass  # no AM/PM given, or the time is already 24-hour
         
+        # Register the fonts while waiting on Prokerala
+        threading.Thread(target=setup_fonts, daemon=True).start()
         chart_data = get_chart_from_prokerala(birth_date, birth_time, birth_place)
         
         if chart_data:
@@ -2164,22 +3229,43 @@ def generate_book(user_data, output_path):
     # Fall back to provided chart data or defaults
     if not chart_data:
         print("⚠️ Using provided/default chart data")
-        chart_data = {
-            'sun_sign': user_data.get('sun_sign') or 'Aries',
-            'moon_sign': user_data.get('moon_sign') or 'Aries',
-            'rising_sign': user_data.get('rising_sign') or 'Aries',
-            'mercury': user_data.get('mercury') or 'Aries',
-            'venus': user_data.get('venus') or 'Aries',
-            'mars': user_data.get('mars') or 'Aries',
-            'jupiter': user_data.get('jupiter') or 'Aries',
-            'saturn': user_data.get('saturn') or 'Aries',
-            'midheaven': user_data.get('midheaven') or 'Aries',
-            'north_node': user_data.get('north_node') or 'Aries',
-        }
+        chart_data = {key: value or 'Aries' for key, value in provided.items()}
     
     return generate_ai_book(user_data, chart_data, output_path)
 
 
+def generate_book_job(job):
+    """Worker entry point for generate_books_bulk - never raises"""
+    user_data, output_path = job
+    try:
+        return generate_book(user_data, output_path)
+    except Exception as e:
+        print(f"❌ Book generation failed for {output_path}: {e}")
+        return None
+
+
+def generate_books_bulk(user_data_list, output_dir, max_workers=None):
+    """
+    Generate many books in parallel, one worker process per CPU.
+    Returns the output paths in input order (None for books that failed).
+    """
+    # Only the bulk runner needs processes - keep multiprocessing out of the import path
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = []
+    for i, user_data in enumerate(user_data_list):
+        name = user_data.get('name') or user_data.get('first_name') or 'Friend'
+        safe_name = "".join(c for c in name if c.isalnum() or c == ' ').replace(' ', '_')
+        jobs.append((user_data, os.path.join(output_dir, f"orastria_{safe_name}_{i + 1}.pdf")))
+    
+    # Spawn fresh workers so font registration and HTTP sessions are never shared across a fork
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(generate_book_job, jobs))
+
+
 if __name__ == "__main__":
     # Test with complete data
     user_data = {